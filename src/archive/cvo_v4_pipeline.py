@@ -16,6 +16,21 @@ import json
 import os
 from datetime import datetime
 from typing import Dict, List, Tuple
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+try:
+    import python_calamine  # engine 'calamine' untuk pd.read_excel, baru ada sejak pandas 2.2
+    CALAMINE_AVAILABLE = tuple(int(v) for v in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    CALAMINE_AVAILABLE = False
+try:
+    import pyarrow  # engine untuk cache Parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -24,11 +39,63 @@ print("CVO v4.0 - Revenue × Tenure Matrix & Cross-sell Engine")
 print("="*80)
 
 
+def _read_excel_cached(path, cache_path, **kwargs):
+    """pd.read_excel dengan cache Parquet; cache dipakai selama tidak lebih tua dari file sumber"""
+    if PYARROW_AVAILABLE and os.path.exists(cache_path) \
+            and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        try:
+            df = pd.read_parquet(cache_path, engine='pyarrow')
+            # Parquet mengembalikan None untuk sel kosong di kolom teks; samakan dengan read_excel (NaN)
+            obj_cols = df.columns[df.dtypes == object]
+            df[obj_cols] = df[obj_cols].where(df[obj_cols].notna(), np.nan)
+            print(f"   Cache Parquet dipakai: {cache_path}")
+            return df
+        except Exception as e:
+            print(f"   [WARN] Cache Parquet tidak terbaca, baca ulang Excel: {e}")
+    
+    df = pd.read_excel(path, engine='calamine' if CALAMINE_AVAILABLE else 'openpyxl', **kwargs)
+    
+    if PYARROW_AVAILABLE:
+        try:
+            df.to_parquet(cache_path, engine='pyarrow', compression='zstd', index=False)
+        except Exception as e:
+            # Kolom campuran (angka + teks) tidak bisa disimpan ke Parquet
+            print(f"   [WARN] Cache Parquet dilewati: {e}")
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+    return df
+
+
+def _excel_writer(path):
+    """ExcelWriter dengan xlsxwriter bila ada (lebih cepat & hemat memori), fallback openpyxl"""
+    if XLSXWRITER_AVAILABLE:
+        # Opsi constant_memory tidak bisa dipakai: pandas menulis sel per kolom,
+        # sedangkan xlsxwriter di mode itu membuang sel dari baris yang sudah di-flush
+        return pd.ExcelWriter(path, engine='xlsxwriter',
+                              engine_kwargs={'options': {'strings_to_urls': False}})
+    return pd.ExcelWriter(path, engine='openpyxl')
+
+
+def _downcast(df, cols):
+    """Downcast ke integer terkecil bila semua nilai bulat (lossless); selain itu tetap float64"""
+    for col in cols:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+
+
 class CVORevenueTenureAnalyzer:
     """
     Analisis CVO dengan fokus Revenue × Tenure Matrix
     """
     
+    # Kolom sumber yang dipakai pipeline; kolom lain tidak ikut diparse
+    SOURCE_COLUMNS = {
+        'idPelanggan', 'namaPelanggan', 'statusLayanan',
+        'Lama_Langganan', 'lama_langganan', 'tanggalAktivasi',
+        'hargaPelanggan', 'pendapatan', 'bandwidth', 'Bandwidth Fix',
+        'segmenCustomer', 'WILAYAH', 'Kategori_Baru', 'Kelompok Tier', 'ProdukBaru'
+    }
+    
     def __init__(self, data_path: str, output_dir: str = 'cvo_v4_results'):
         self.data_path = data_path
         self.output_dir = output_dir
@@ -39,7 +106,12 @@ class CVORevenueTenureAnalyzer:
     def load_data(self):
         """Load data penuh"""
         print("\n[DATA] Memuat data...")
-        self.df = pd.read_excel(self.data_path, engine='openpyxl')
+        # Cache terpisah dari smart classifier karena hanya berisi SOURCE_COLUMNS
+        self.df = _read_excel_cached(
+            self.data_path,
+            self.data_path + '.v4.parquet',
+            usecols=lambda col: col in self.SOURCE_COLUMNS
+        )
         print(f"[OK] {len(self.df):,} pelanggan dimuat")
         print(f"   Kolom: {len(self.df.columns)}")
         return self.df
@@ -50,6 +122,7 @@ class CVORevenueTenureAnalyzer:
         
         # Hanya pelanggan aktif
         if 'statusLayanan' in self.df.columns:
+            self.df['statusLayanan'] = self.df['statusLayanan'].astype('category')
             self.df = self.df[self.df['statusLayanan'] == 'AKTIF']
         
         # Konversi lama_langganan ke numeric (dari object/string)
@@ -75,34 +148,25 @@ class CVORevenueTenureAnalyzer:
         if 'bandwidth' in self.df.columns:
             self.df['bandwidth_mbps'] = pd.to_numeric(self.df['bandwidth'], errors='coerce').fillna(0)
         elif 'Bandwidth Fix' in self.df.columns:
-            # Parse bandwidth fix
-            def parse_bandwidth(val):
-                if pd.isna(val) or val == 'Tidak Ada':
-                    return 0
-                try:
-                    # Extract number from strings like "20 MBPS"
-                    import re
-                    match = re.search(r'(\d+)', str(val))
-                    return int(match.group(1)) if match else 0
-                except:
-                    return 0
-            self.df['bandwidth_mbps'] = self.df['Bandwidth Fix'].apply(parse_bandwidth)
-        
-        # Simplified bandwidth cluster
-        def get_bandwidth_cluster(row):
-            bw = row['bandwidth_mbps']
-            if bw == 0:
-                return 'NO_BANDWIDTH'
-            elif bw < 1:  # KBPS or very low
-                return 'ATM_IOT'
-            else:
-                return 'HAS_BANDWIDTH'  # Will be mapped to segmen
-        
-        self.df['bandwidth_cluster'] = self.df.apply(get_bandwidth_cluster, axis=1)
+            # Parse bandwidth fix: angka pertama dari "20 MBPS", 0 jika kosong/'Tidak Ada'
+            bw_raw = self.df['Bandwidth Fix']
+            bw_raw = bw_raw.where(bw_raw.ne('Tidak Ada'))
+            bw_num = bw_raw.astype('string').str.extract(r'(\d+)', expand=False)
+            self.df['bandwidth_mbps'] = pd.to_numeric(bw_num, errors='coerce').fillna(0).astype('int64')
+        
+        # Simplified bandwidth cluster (HAS_BANDWIDTH akan di-map ke segmen)
+        bw = self.df['bandwidth_mbps']
+        self.df['bandwidth_cluster'] = np.select(
+            [bw == 0, bw < 1],  # bw < 1: KBPS or very low
+            ['NO_BANDWIDTH', 'ATM_IOT'],
+            default='HAS_BANDWIDTH'
+        )
+        self.df['bandwidth_cluster'] = self.df['bandwidth_cluster'].astype('category')
         
         # Fill missing values
         self.df['tenure_years'] = self.df['tenure_years'].fillna(0)
         self.df['revenue'] = self.df['revenue'].fillna(0)
+        _downcast(self.df, ['bandwidth_mbps', 'tenure_years', 'revenue'])
         
         print(f"[OK] {len(self.df):,} pelanggan aktif")
         print(f"   Rata-rata tenure: {self.df['tenure_years'].mean():.1f} tahun")
@@ -129,21 +193,18 @@ class CVORevenueTenureAnalyzer:
         print(f"   Median Revenue: Rp {revenue_median:,.0f}")
         print(f"   Median Tenure: {tenure_median:.1f} tahun")
         
-        # Definisikan kuadran
-        def get_quadrant(row):
-            revenue = row['revenue']
-            tenure = row['tenure_years']
-            
-            if revenue >= revenue_median and tenure >= tenure_median:
-                return 'SULTAN LOYAL'
-            elif revenue >= revenue_median and tenure < tenure_median:
-                return 'ORANG KAYA BARU'
-            elif revenue < revenue_median and tenure >= tenure_median:
-                return 'SAHABAT HEMAT'
-            else:
-                return 'PEMULA'
+        # Definisikan kuadran (NaN tidak lolos >= maupun <, jatuh ke PEMULA)
+        revenue = self.df['revenue'].to_numpy()
+        tenure = self.df['tenure_years'].to_numpy()
+        hi_rev, lo_rev = revenue >= revenue_median, revenue < revenue_median
+        hi_ten, lo_ten = tenure >= tenure_median, tenure < tenure_median
         
-        self.df['revenue_tenure_quadrant'] = self.df.apply(get_quadrant, axis=1)
+        self.df['revenue_tenure_quadrant'] = np.select(
+            [hi_rev & hi_ten, hi_rev & lo_ten, lo_rev & hi_ten],
+            ['SULTAN LOYAL', 'ORANG KAYA BARU', 'SAHABAT HEMAT'],
+            default='PEMULA'
+        )
+        self.df['revenue_tenure_quadrant'] = self.df['revenue_tenure_quadrant'].astype('category')
         
         # Strategi per kuadran
         strategies = {
@@ -173,18 +234,25 @@ class CVORevenueTenureAnalyzer:
             }
         }
         
-        # Add strategy columns
-        self.df['strategy'] = self.df['revenue_tenure_quadrant'].map(lambda x: strategies[x]['strategy'])
-        self.df['action'] = self.df['revenue_tenure_quadrant'].map(lambda x: strategies[x]['action'])
-        self.df['priority'] = self.df['revenue_tenure_quadrant'].map(lambda x: strategies[x]['priority'])
-        self.df['quadrant_color'] = self.df['revenue_tenure_quadrant'].map(lambda x: strategies[x]['color'])
+        # Add strategy columns (dict lookup per kategori kuadran, bukan lambda per baris)
+        quadrant = self.df['revenue_tenure_quadrant']
+        for col, key in [('strategy', 'strategy'), ('action', 'action'),
+                         ('priority', 'priority'), ('quadrant_color', 'color')]:
+            self.df[col] = quadrant.map({q: info[key] for q, info in strategies.items()})
+        
+        # map pada kuadran categorical bisa menghasilkan Categorical; dtype dibuat eksplisit:
+        # label kardinalitas rendah sebagai category, action & warna tetap string
+        for col in ['strategy', 'priority']:
+            self.df[col] = self.df[col].astype('category')
+        for col in ['action', 'quadrant_color']:
+            self.df[col] = self.df[col].astype(object)
         
         # Print summary
         print("\n   Distribusi Kuadran:")
-        quadrant_summary = self.df.groupby('revenue_tenure_quadrant').agg({
-            'idPelanggan': 'count',
-            'revenue': 'sum'
-        }).round(0)
+        quadrant_summary = self.df.groupby('revenue_tenure_quadrant', observed=True).agg(
+            count=('revenue', 'size'),
+            revenue=('revenue', 'sum')
+        ).round(0)
         quadrant_summary.columns = ['Jumlah', 'Total Revenue']
         print(quadrant_summary)
         
@@ -239,38 +307,35 @@ class CVORevenueTenureAnalyzer:
             }
         }
         
-        def get_cross_sell_recommendation(row):
-            kategori = row.get('Kategori_Baru', 'Digital Infrastructure')
-            segmen = row.get('segmenCustomer', 'RETAIL DISTRIBUTION')
-            
-            # Default recommendation
-            base_rec = cross_sell_map.get(kategori, cross_sell_map['Digital Infrastructure'])
-            
-            # Customize based on segmen
-            segmen_products = {
-                'GOVERNMENT': ['e-Government', 'Command Center', 'Disaster Recovery'],
-                'BANKING & FINANCIAL': ['SDWAN', 'Managed Security', 'Backup Connectivity'],
-                'RETAIL DISTRIBUTION': ['POS System', 'Inventory Management', 'Digital Payment'],
-                'HEALTHCARE': ['Telemedicine', 'Medical IoT', 'Hospital Information System'],
-                'EDUCATION': ['E-Learning', 'Digital Library', 'Smart Campus'],
-                'MANUFACTURING': ['Industry 4.0', 'Predictive Maintenance', 'Smart Factory']
-            }
-            
-            # Add segmen-specific products
-            specific_products = segmen_products.get(segmen, [])
-            all_products = base_rec['products'] + specific_products
-            
-            return {
-                'target_category': base_rec['target'],
-                'recommended_products': ' | '.join(all_products[:3]),
-                'upsell_potential': row['revenue'] * 0.3  # Assume 30% upsell
-            }
+        # Customize based on segmen
+        segmen_products = {
+            'GOVERNMENT': ['e-Government', 'Command Center', 'Disaster Recovery'],
+            'BANKING & FINANCIAL': ['SDWAN', 'Managed Security', 'Backup Connectivity'],
+            'RETAIL DISTRIBUTION': ['POS System', 'Inventory Management', 'Digital Payment'],
+            'HEALTHCARE': ['Telemedicine', 'Medical IoT', 'Hospital Information System'],
+            'EDUCATION': ['E-Learning', 'Digital Library', 'Smart Campus'],
+            'MANUFACTURING': ['Industry 4.0', 'Predictive Maintenance', 'Smart Factory']
+        }
         
-        # Apply recommendations
-        recommendations = self.df.apply(get_cross_sell_recommendation, axis=1)
-        self.df['cross_sell_target'] = recommendations.apply(lambda x: x['target_category'])
-        self.df['cross_sell_products'] = recommendations.apply(lambda x: x['recommended_products'])
-        self.df['upsell_potential'] = recommendations.apply(lambda x: x['upsell_potential'])
+        # Kategori/segmen di luar mapping (termasuk NaN) pakai default
+        kategori = self.df.get('Kategori_Baru', pd.Series('Digital Infrastructure', index=self.df.index))
+        kategori = kategori.where(kategori.isin(list(cross_sell_map)), 'Digital Infrastructure')
+        segmen = self.df.get('segmenCustomer', pd.Series('RETAIL DISTRIBUTION', index=self.df.index))
+        segmen = segmen.where(segmen.isin(list(segmen_products)), '')
+        
+        # Teks rekomendasi dihitung sekali per (kategori, segmen), bukan per baris
+        products_joined = pd.Series({
+            (kat, seg): ' | '.join((rec['products'] + segmen_products.get(seg, []))[:3])
+            for kat, rec in cross_sell_map.items()
+            for seg in [*segmen_products, '']
+        })
+        target_category = pd.Series({kat: rec['target'] for kat, rec in cross_sell_map.items()})
+        
+        self.df['cross_sell_target'] = kategori.map(target_category)
+        self.df['cross_sell_products'] = products_joined.reindex(
+            pd.MultiIndex.from_arrays([kategori, segmen])
+        ).to_numpy()
+        self.df['upsell_potential'] = self.df['revenue'].to_numpy() * 0.3  # Assume 30% upsell
         
         print("[OK] Rekomendasi cross-sell dibuat")
         
@@ -333,23 +398,33 @@ class CVORevenueTenureAnalyzer:
         matrix_data = self.df[matrix_columns].copy()
         matrix_data.columns = [col.lower().replace(' ', '_') for col in matrix_data.columns]
         
-        # Convert to records
-        records = matrix_data.to_dict('records')
-        
-        with open(f'{dashboard_dir}/revenue_tenure_matrix.json', 'w', encoding='utf-8') as f:
-            json.dump(records, f, indent=2, ensure_ascii=False)
-        print(f"   [OK] revenue_tenure_matrix.json ({len(records)} records)")
-        
-        # 3. Top Opportunities
-        top_opportunities = self.df.nlargest(100, 'upsell_potential')[
+        # JSON records selalu ditulis: copy_v4_data.py dan dashboard hanya membaca .json (NaN menjadi null)
+        matrix_data.to_json(f'{dashboard_dir}/revenue_tenure_matrix.json', orient='records',
+                            indent=2, force_ascii=False, double_precision=15)
+        print(f"   [OK] revenue_tenure_matrix.json ({len(matrix_data)} records)")
+        
+        # Parquet (zstd) tambahan bila pyarrow ada, untuk konsumen kolumnar
+        if PYARROW_AVAILABLE:
+            parquet_path = f'{dashboard_dir}/revenue_tenure_matrix.parquet'
+            try:
+                matrix_data.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+                print(f"   [OK] revenue_tenure_matrix.parquet ({len(matrix_data)} records)")
+            except Exception as e:
+                print(f"   [WARN] Parquet gagal, hanya JSON: {e}")
+                if os.path.exists(parquet_path):
+                    os.remove(parquet_path)
+        
+        # 3. Top Opportunities (dipakai juga untuk sheet Excel)
+        top100 = self._top_n(self.df, 'upsell_potential', 100)
+        top_opportunities = top100[
             ['idPelanggan', 'namaPelanggan', 'revenue', 'tenure_years',
              'revenue_tenure_quadrant', 'strategy', 'cross_sell_products',
              'upsell_potential', 'priority'] + 
             [col for col in ['segmenCustomer', 'WILAYAH', 'Kategori_Baru', 'Kelompok Tier'] if col in self.df.columns]
-        ].to_dict('records')
+        ]
         
-        with open(f'{dashboard_dir}/top_100_opportunities.json', 'w', encoding='utf-8') as f:
-            json.dump(top_opportunities, f, indent=2, ensure_ascii=False)
+        top_opportunities.to_json(f'{dashboard_dir}/top_100_opportunities.json', orient='records',
+                                  indent=2, force_ascii=False, double_precision=15)
         print(f"   [OK] top_100_opportunities.json ({len(top_opportunities)} records)")
         
         # 4. Quadrant Analysis
@@ -386,7 +461,7 @@ class CVORevenueTenureAnalyzer:
         
         # 6. Excel Export for Sales Team
         excel_path = os.path.join(self.output_dir, 'CVO_v4_Master_Results.xlsx')
-        with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+        with _excel_writer(excel_path) as writer:
             # Sheet 1: All customers
             export_cols = [
                 'idPelanggan', 'namaPelanggan', 'revenue', 'tenure_years',
@@ -408,7 +483,6 @@ class CVORevenueTenureAnalyzer:
                     quad_data[export_cols].to_excel(writer, sheet_name=sheet_name, index=False)
             
             # Sheet 3: Top 100 Opportunities
-            top100 = self.df.nlargest(100, 'upsell_potential')
             top100[export_cols].to_excel(writer, sheet_name='Top 100 Opportunities', index=False)
         
         print(f"   [OK] Excel: {excel_path}")
@@ -417,6 +491,22 @@ class CVORevenueTenureAnalyzer:
         
         return dashboard_dir
     
+    @staticmethod
+    def _top_n(df: pd.DataFrame, col: str, n: int) -> pd.DataFrame:
+        """Baris yang sama dengan df.nlargest(n, col), lewat partisi O(N) tanpa full sort
+        
+        Nilai sama diurutkan stabil sesuai urutan baris.
+        """
+        vals = df[col].to_numpy(dtype=np.float64)
+        k = min(n, vals.size)
+        if k == 0:
+            return df.iloc[:0]
+        kth = np.partition(vals, vals.size - k)[vals.size - k]
+        above = np.flatnonzero(vals > kth)
+        ties = np.flatnonzero(vals == kth)[:k - above.size]
+        idx = np.sort(np.concatenate([above, ties]))
+        return df.iloc[idx[np.argsort(-vals[idx], kind='stable')]]
+    
     def run_pipeline(self):
         """Jalankan full pipeline"""
         print("\n" + "="*80)
@@ -435,7 +525,7 @@ class CVORevenueTenureAnalyzer:
         print(f"\nDashboard data tersedia di: {dashboard_dir}")
         print("\nFiles generated:")
         print("   - summary_metrics.json")
-        print("   - revenue_tenure_matrix.json")
+        print("   - revenue_tenure_matrix.json (+ .parquet bila pyarrow ada)")
         print("   - top_100_opportunities.json")
         print("   - quadrant_analysis.json")
         print("   - filter_options.json")
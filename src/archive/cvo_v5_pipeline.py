@@ -16,15 +16,67 @@ import pandas as pd
 import numpy as np
 import json
 import os
+import re
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import python_calamine  # noqa: F401  engine 'calamine' untuk pd.read_excel, baru ada sejak pandas 2.2
+    CALAMINE_AVAILABLE = tuple(int(v) for v in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    CALAMINE_AVAILABLE = False
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 print("="*80)
 print("CVO v5.0 - End-to-End Customer Value Optimizer")
 print("="*80)
 
+# Kata kunci role produk (Kategori_Baru, huruf besar); urutan grup = prioritas
+_HIGH_MARGIN_TOKENS = ('SMART', 'GREEN', 'DIGITAL SOLUTION')
+_CORE_RETENTION_TOKENS = ('INFRA', 'CONNECTIVITY')
+_ADD_ON_TOKENS = ('TECHNOLOGY', 'SERVICE', 'MANAGED')
+_HIGH_MARGIN_RE = re.compile('|'.join(map(re.escape, _HIGH_MARGIN_TOKENS)))
+_CORE_RETENTION_RE = re.compile('|'.join(map(re.escape, _CORE_RETENTION_TOKENS)))
+_ADD_ON_RE = re.compile('|'.join(map(re.escape, _ADD_ON_TOKENS)))
+
+# Reader Excel berbasis Rust jauh lebih cepat dari openpyxl untuk file besar
+EXCEL_ENGINE = 'calamine' if CALAMINE_AVAILABLE else 'openpyxl'
+
+
+def _dump_json(obj, path: str, indent: bool = True):
+    """Tulis JSON (orjson bila tersedia, fallback ke json standar)
+    
+    indent=False untuk file yang hanya dibaca dashboard: lebih kecil dan lebih cepat ditulis.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2 if indent else None, ensure_ascii=False)
+
+
+def _downcast(df, cols):
+    """Downcast ke integer terkecil bila semua nilai bulat (lossless); selain itu tetap float64"""
+    for col in cols:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+
 
 class DataCleaner:
     """
@@ -32,6 +84,12 @@ class DataCleaner:
     ============================================
     """
     
+    # Urutan kategori hasil *_vec (dari kecil ke besar)
+    BANDWIDTH_CLUSTERS = ['NO_BANDWIDTH', 'MICRO', 'LOW', 'MID', 'HIGH']
+    REVENUE_CLUSTERS = ['ZERO', 'LOW', 'STANDARD', 'HIGH']
+    TENURE_CLUSTERS = ['NEW', 'ESTABLISHED', 'LOYAL']
+    PRODUCT_ROLES = ['HIGH_MARGIN', 'CORE_RETENTION', 'ADD_ON', 'UNKNOWN']
+    
     @staticmethod
     def clean_bandwidth(bandwidth_value):
         """
@@ -86,9 +144,42 @@ class DataCleaner:
         else:
             return 'LOYAL'
     
+    @classmethod
+    def clean_bandwidth_vec(cls, values) -> pd.Categorical:
+        """clean_bandwidth untuk satu kolom sekaligus (batas sama, hasil Categorical)"""
+        bw = np.asarray(values, dtype=np.float64)
+        codes = np.select(
+            [np.isnan(bw) | (bw == 0), bw < 10, bw < 100, bw < 500],
+            [0, 1, 2, 3],
+            default=4
+        )
+        return pd.Categorical.from_codes(codes, categories=cls.BANDWIDTH_CLUSTERS)
+    
+    @classmethod
+    def clean_revenue_vec(cls, values) -> pd.Categorical:
+        """clean_revenue untuk satu kolom sekaligus (batas sama, hasil Categorical)"""
+        rev = np.asarray(values, dtype=np.float64)
+        codes = np.select(
+            [np.isnan(rev) | (rev == 0), rev < 500000, rev < 2000000],
+            [0, 1, 2],
+            default=3
+        )
+        return pd.Categorical.from_codes(codes, categories=cls.REVENUE_CLUSTERS)
+    
+    @classmethod
+    def clean_tenure_vec(cls, values) -> pd.Categorical:
+        """clean_tenure untuk satu kolom sekaligus (batas sama, hasil Categorical)"""
+        tenure = np.asarray(values, dtype=np.float64)
+        codes = np.select(
+            [np.isnan(tenure) | (tenure < 5), tenure <= 10],
+            [0, 1],
+            default=2
+        )
+        return pd.Categorical.from_codes(codes, categories=cls.TENURE_CLUSTERS)
+    
     @staticmethod
     def calculate_ltv(monthly_revenue, tenure):
-        """Calculate Lifetime Value"""
+        """Calculate Lifetime Value (skalar; run_pipeline menghitung per kolom)"""
         if pd.isna(monthly_revenue) or pd.isna(tenure):
             return 0
         return monthly_revenue * 12 * tenure
@@ -106,14 +197,28 @@ class DataCleaner:
         
         kategori = str(kategori_baru).upper()
         
-        if 'SMART' in kategori or 'GREEN' in kategori or 'DIGITAL SOLUTION' in kategori:
+        if any(token in kategori for token in _HIGH_MARGIN_TOKENS):
             return 'HIGH_MARGIN'
-        elif 'INFRA' in kategori or 'CONNECTIVITY' in kategori:
+        elif any(token in kategori for token in _CORE_RETENTION_TOKENS):
             return 'CORE_RETENTION'
-        elif 'TECHNOLOGY' in kategori or 'SERVICE' in kategori or 'MANAGED' in kategori:
+        elif any(token in kategori for token in _ADD_ON_TOKENS):
             return 'ADD_ON'
         else:
             return 'UNKNOWN'
+    
+    @classmethod
+    def tag_product_role_vec(cls, kategori_baru: pd.Series) -> pd.Categorical:
+        """tag_product_role untuk satu kolom sekaligus (kata kunci sama, hasil Categorical)"""
+        # NaN menjadi 'NAN' yang tidak cocok dengan kata kunci mana pun -> UNKNOWN
+        kategori = kategori_baru.astype(str).str.upper()
+        codes = np.select(
+            [kategori.str.contains(_HIGH_MARGIN_RE).to_numpy(),
+             kategori.str.contains(_CORE_RETENTION_RE).to_numpy(),
+             kategori.str.contains(_ADD_ON_RE).to_numpy()],
+            [0, 1, 2],
+            default=3
+        )
+        return pd.Categorical.from_codes(codes, categories=cls.PRODUCT_ROLES)
 
 
 class StrategicMatrixAnalyzer:
@@ -205,6 +310,28 @@ class StrategicMatrixAnalyzer:
             }
 
 
+    @classmethod
+    def analyze_sales_matrix_vec(cls, revenue, bandwidth_cluster) -> Dict[str, np.ndarray]:
+        """analyze_sales_matrix untuk satu kolom sekaligus: {quadrant/strategy/color/action: array}"""
+        rev_high = np.asarray(revenue, dtype=np.float64) >= 2000000
+        bw_high = pd.Series(bandwidth_cluster).isin(['MID', 'HIGH']).to_numpy()
+        # Kode = urutan cabang di analyze_sales_matrix; tabel diambil dari versi skalar
+        codes = np.select([rev_high & bw_high, rev_high, bw_high], [0, 1, 2], default=3)
+        table = [cls.analyze_sales_matrix(rev, bw)
+                 for rev, bw in [(2000000, 'HIGH'), (2000000, 'LOW'), (0, 'HIGH'), (0, 'LOW')]]
+        return {key: np.array([t[key] for t in table], dtype=object)[codes] for key in table[0]}
+    
+    @classmethod
+    def analyze_trust_matrix_vec(cls, ltv, tenure_cluster) -> Dict[str, np.ndarray]:
+        """analyze_trust_matrix untuk satu kolom sekaligus: {quadrant/strategy/color/action: array}"""
+        ltv_high = np.asarray(ltv, dtype=np.float64) >= 500000000
+        loyal = (pd.Series(tenure_cluster) == 'LOYAL').to_numpy()
+        codes = np.select([ltv_high & loyal, ltv_high, loyal], [0, 1, 2], default=3)
+        table = [cls.analyze_trust_matrix(value, tenure)
+                 for value, tenure in [(500000000, 'LOYAL'), (500000000, 'NEW'), (0, 'LOYAL'), (0, 'NEW')]]
+        return {key: np.array([t[key] for t in table], dtype=object)[codes] for key in table[0]}
+
+
 class HybridRecommendationEngine:
     """
     FASE 3: Advanced Recommendation Engine (Hybrid Logic)
@@ -212,14 +339,25 @@ class HybridRecommendationEngine:
     """
     
     def __init__(self, product_catalog_path: str):
-        """Initialize dengan product catalog"""
-        self.product_catalog = self._load_product_catalog(product_catalog_path)
+        """Initialize dengan path product catalog (dibaca saat pertama diakses)"""
+        self.product_catalog_path = product_catalog_path
         self.industry_priorities = self._setup_industry_priorities()
+        # Top-2 produk prioritas per segmen beserta teks reasoning-nya, dibentuk sekali
+        self._industry_top2 = {
+            segmen: tuple((product, f"{segmen} needs {product} ({rec['reasoning']})")
+                          for product in rec['priority_products'][:2])
+            for segmen, rec in self.industry_priorities.items()
+        }
         
+    @cached_property
+    def product_catalog(self) -> pd.DataFrame:
+        """Master produk; aturan rekomendasi tidak memakainya, jadi Excel tidak dibaca tiap run"""
+        return self._load_product_catalog(self.product_catalog_path)
+    
     def _load_product_catalog(self, path: str) -> pd.DataFrame:
         """Load master produk dari Excel"""
         if os.path.exists(path):
-            return pd.read_excel(path, engine='openpyxl')
+            return pd.read_excel(path, engine=EXCEL_ENGINE)
         else:
             print(f"[WARN] Product catalog not found: {path}")
             return pd.DataFrame()
@@ -261,24 +399,31 @@ class HybridRecommendationEngine:
         Logic 3: Portfolio Gap Analysis
         Logic 4: Product Hierarchy (Bronze->Gold)
         """
-        segmen = customer_data.get('segmen', 'UNKNOWN')
-        current_tier = customer_data.get('tier', '')
-        current_products = customer_data.get('produk', [])
-        strategy = customer_data.get('strategy', '')
+        return self.generate_recommendation_fast(
+            customer_data.get('segmen', 'UNKNOWN'),
+            str(customer_data.get('tier', '')),
+            str(customer_data.get('produk', [])),
+            customer_data.get('strategy', '')
+        )
+    
+    def generate_recommendation_fast(self, segmen, tier: str, produk: str, strategy: str) -> Dict:
+        """
+        generate_recommendation dengan argumen skalar (tanpa dict/Series per baris)
         
+        tier dan produk sudah berupa string; produk boleh teks ProdukBaru apa adanya
+        karena nama produk yang dicek tidak mengandung koma atau tanda kutip.
+        """
         recommendations = []
         reasoning_parts = []
         
         # Logic 1 & 2: Industry-based recommendation
-        if segmen in self.industry_priorities:
-            industry_rec = self.industry_priorities[segmen]
-            for product in industry_rec['priority_products'][:2]:  # Top 2
-                if product not in str(current_products):
-                    recommendations.append(product)
-                    reasoning_parts.append(f"{segmen} needs {product} ({industry_rec['reasoning']})")
+        for product, reason in self._industry_top2.get(segmen, ()):  # Top 2
+            if product not in produk:
+                recommendations.append(product)
+                reasoning_parts.append(reason)
         
         # Logic 3: Portfolio Gap
-        if 'DI Only' in str(current_tier):
+        if 'DI Only' in tier:
             if strategy == 'CROSS_SELL':
                 recommendations.append('Managed Services')
                 reasoning_parts.append("Portfolio Gap: Has DI but missing Managed Services")
@@ -287,7 +432,7 @@ class HybridRecommendationEngine:
                 reasoning_parts.append("Upsell opportunity: Upgrade DI tier")
         
         # Logic 4: Product Hierarchy (Bronze->Gold)
-        if 'Bronze' in str(current_products) or 'Basic' in str(current_products):
+        if 'Bronze' in produk or 'Basic' in produk:
             recommendations.append('Upgrade to Gold/Premium')
             reasoning_parts.append("Product Hierarchy: Bronze user ready for Gold upgrade")
         
@@ -310,10 +455,21 @@ class CVOPipeline:
     ==========================
     """
     
-    def __init__(self, data_path: str, product_catalog_path: str, output_dir: str = 'cvo_v5_output'):
+    # Kolom customers_v5.json / customers_v5.parquet (urutan = urutan key di JSON)
+    CUSTOMER_EXPORT_COLS = (
+        'idPelanggan', 'namaPelanggan', 'segmenCustomer', 'monthly_revenue',
+        'bandwidth_mbps', 'bandwidth_cluster', 'tenure_years', 'tenure_cluster',
+        'ltv', 'sales_quadrant', 'sales_strategy', 'trust_quadrant', 'trust_strategy',
+        'recommendation_primary', 'recommendation_secondary', 'recommendation_reasoning',
+        'confidence_score', 'sales_color'
+    )
+    
+    def __init__(self, data_path: str, product_catalog_path: str, output_dir: str = 'cvo_v5_output',
+                 export_excel: bool = True):
         self.data_path = data_path
         self.product_catalog_path = product_catalog_path
         self.output_dir = output_dir
+        self.export_excel = export_excel
         self.cleaner = DataCleaner()
         self.matrix_analyzer = StrategicMatrixAnalyzer()
         self.recommender = HybridRecommendationEngine(product_catalog_path)
@@ -328,7 +484,7 @@ class CVOPipeline:
         
         # 1. Load Data
         print("\n[1/5] Loading data...")
-        df = pd.read_excel(self.data_path, engine='openpyxl')
+        df = pd.read_excel(self.data_path, engine=EXCEL_ENGINE)
         print(f"   Loaded {len(df):,} customers")
         
         # 2. Data Cleaning & Feature Engineering
@@ -336,32 +492,34 @@ class CVOPipeline:
         
         # Revenue
         df['monthly_revenue'] = pd.to_numeric(df.get('hargaPelanggan', 0), errors='coerce').fillna(0)
-        df['revenue_cluster'] = df['monthly_revenue'].apply(self.cleaner.clean_revenue)
+        df['revenue_cluster'] = self.cleaner.clean_revenue_vec(df['monthly_revenue'])
         
         # Bandwidth
         df['bandwidth_mbps'] = 0
         if 'bandwidth' in df.columns:
             df['bandwidth_mbps'] = pd.to_numeric(df['bandwidth'], errors='coerce').fillna(0)
         elif 'Bandwidth Fix' in df.columns:
-            def parse_bw(val):
-                if pd.isna(val) or val == 'Tidak Ada':
-                    return 0
-                import re
-                match = re.search(r'(\d+)', str(val))
-                return int(match.group(1)) if match else 0
-            df['bandwidth_mbps'] = df['Bandwidth Fix'].apply(parse_bw)
+            # Angka pertama dari "20 MBPS", 0 jika kosong/'Tidak Ada' (satu pass regex per kolom)
+            bw_raw = df['Bandwidth Fix']
+            bw_raw = bw_raw.where(bw_raw.ne('Tidak Ada'))
+            bw_num = bw_raw.astype('string').str.extract(r'(\d+)', expand=False)
+            df['bandwidth_mbps'] = pd.to_numeric(bw_num, errors='coerce').fillna(0).astype('int64')
         
-        df['bandwidth_cluster'] = df['bandwidth_mbps'].apply(self.cleaner.clean_bandwidth)
+        df['bandwidth_cluster'] = self.cleaner.clean_bandwidth_vec(df['bandwidth_mbps'])
         
         # Tenure
         df['tenure_years'] = pd.to_numeric(df.get('Lama_Langganan', 0), errors='coerce').fillna(0)
-        df['tenure_cluster'] = df['tenure_years'].apply(self.cleaner.clean_tenure)
+        df['tenure_cluster'] = self.cleaner.clean_tenure_vec(df['tenure_years'])
         
         # LTV
-        df['ltv'] = df.apply(lambda x: self.cleaner.calculate_ltv(x['monthly_revenue'], x['tenure_years']), axis=1)
+        # Revenue & tenure sudah fillna(0), jadi cukup satu perkalian kolom (urutan sama dengan calculate_ltv)
+        df['ltv'] = df['monthly_revenue'].to_numpy() * 12 * df['tenure_years'].to_numpy()
         
         # Product Role
-        df['product_role'] = df.get('Kategori_Baru', '').apply(self.cleaner.tag_product_role)
+        if 'Kategori_Baru' in df.columns:
+            df['product_role'] = self.cleaner.tag_product_role_vec(df['Kategori_Baru'])
+        else:
+            df['product_role'] = 'UNKNOWN'
         
         print(f"   Revenue clusters: {df['revenue_cluster'].value_counts().to_dict()}")
         print(f"   Bandwidth clusters: {df['bandwidth_cluster'].value_counts().to_dict()}")
@@ -370,49 +528,51 @@ class CVOPipeline:
         # 3. Strategic Matrix Analysis
         print("\n[3/5] Analyzing strategic matrices...")
         
-        sales_matrix_results = df.apply(
-            lambda x: self.matrix_analyzer.analyze_sales_matrix(x['monthly_revenue'], x['bandwidth_cluster']), 
-            axis=1
-        )
-        df['sales_quadrant'] = [r['quadrant'] for r in sales_matrix_results]
-        df['sales_strategy'] = [r['strategy'] for r in sales_matrix_results]
-        df['sales_action'] = [r['action'] for r in sales_matrix_results]
-        df['sales_color'] = [r['color'] for r in sales_matrix_results]
-        
-        trust_matrix_results = df.apply(
-            lambda x: self.matrix_analyzer.analyze_trust_matrix(x['ltv'], x['tenure_cluster']),
-            axis=1
-        )
-        df['trust_quadrant'] = [r['quadrant'] for r in trust_matrix_results]
-        df['trust_strategy'] = [r['strategy'] for r in trust_matrix_results]
-        df['trust_action'] = [r['action'] for r in trust_matrix_results]
-        df['trust_color'] = [r['color'] for r in trust_matrix_results]
+        sales_matrix = self.matrix_analyzer.analyze_sales_matrix_vec(df['monthly_revenue'], df['bandwidth_cluster'])
+        for key in ['quadrant', 'strategy', 'action', 'color']:
+            df[f'sales_{key}'] = sales_matrix[key]
         
-        print(f"   Sales Matrix: {df['sales_quadrant'].value_counts().to_dict()}")
-        print(f"   Trust Matrix: {df['trust_quadrant'].value_counts().to_dict()}")
+        trust_matrix = self.matrix_analyzer.analyze_trust_matrix_vec(df['ltv'], df['tenure_cluster'])
+        for key in ['quadrant', 'strategy', 'action', 'color']:
+            df[f'trust_{key}'] = trust_matrix[key]
+        
+        # Dihitung sekali, dipakai ulang untuk summary_v5.json
+        sales_counts = df['sales_quadrant'].value_counts().to_dict()
+        trust_counts = df['trust_quadrant'].value_counts().to_dict()
+        print(f"   Sales Matrix: {sales_counts}")
+        print(f"   Trust Matrix: {trust_counts}")
         
         # 4. Hybrid Recommendation
         print("\n[4/5] Generating hybrid recommendations...")
         
-        recommendations = []
-        for idx, row in df.iterrows():
-            customer_data = {
-                'segmen': row.get('segmenCustomer', 'UNKNOWN'),
-                'tier': row.get('Kelompok Tier', ''),
-                'produk': str(row.get('ProdukBaru', '')).split(','),
-                'strategy': row['sales_strategy']
-            }
-            rec = self.recommender.generate_recommendation(customer_data)
-            recommendations.append(rec)
-        
-        df['recommendation_primary'] = [r['primary_recommendation'] for r in recommendations]
-        df['recommendation_secondary'] = [r['secondary_recommendation'] for r in recommendations]
-        df['recommendation_reasoning'] = [r['reasoning'] for r in recommendations]
-        df['confidence_score'] = [r['confidence_score'] for r in recommendations]
+        # Kolom mentah di-zip langsung (tanpa Series per baris dari iterrows)
+        n = len(df)
+        segmen_arr = (df['segmenCustomer'].fillna('UNKNOWN').to_numpy()
+                      if 'segmenCustomer' in df.columns else np.full(n, 'UNKNOWN'))
+        tier_arr = df['Kelompok Tier'].astype(str).to_numpy() if 'Kelompok Tier' in df.columns else np.full(n, '')
+        produk_arr = df['ProdukBaru'].astype(str).to_numpy() if 'ProdukBaru' in df.columns else np.full(n, '')
+        # Kode integer per kombinasi unik; rekomendasi dihitung sekali per kombinasi
+        # lalu disebar ke semua baris dengan indexing NumPy
+        keys = pd.DataFrame({'segmen': segmen_arr, 'tier': tier_arr, 'produk': produk_arr,
+                             'strategy': df['sales_strategy'].to_numpy()})
+        codes = keys.groupby(list(keys.columns), sort=False, dropna=False).ngroup().to_numpy()
+        recommend = self.recommender.generate_recommendation_fast
+        recommendations = [recommend(*combo) for combo in keys.drop_duplicates().itertuples(index=False)]
+        print(f"   Kombinasi unik: {len(recommendations):,} dari {n:,} pelanggan")
+        
+        for col, key in [('recommendation_primary', 'primary_recommendation'),
+                         ('recommendation_secondary', 'secondary_recommendation'),
+                         ('recommendation_reasoning', 'reasoning')]:
+            df[col] = np.array([r[key] for r in recommendations], dtype=object)[codes]
+        df['confidence_score'] = np.array([r['confidence_score'] for r in recommendations])[codes]
         
         # 5. Export Results
         print("\n[5/5] Exporting results...")
-        self._export_results(df)
+        # Setelah semua perhitungan: dtype lebih kecil untuk Excel/Parquet/JSON
+        _downcast(df, ['monthly_revenue', 'bandwidth_mbps', 'tenure_years', 'ltv'])
+        for col in ['sales_quadrant', 'sales_strategy', 'trust_quadrant', 'trust_strategy']:
+            df[col] = df[col].astype('category')
+        self._export_results(df, sales_counts, trust_counts)
         
         print("\n" + "="*80)
         print("PIPELINE COMPLETE!")
@@ -420,26 +580,49 @@ class CVOPipeline:
         
         return df
     
-    def _export_results(self, df: pd.DataFrame):
-        """Export hasil untuk dashboard"""
-        
-        # Excel Master
-        excel_path = os.path.join(self.output_dir, 'CVO_v5_Master_Analysis.xlsx')
-        with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-            # All customers
-            df.to_excel(writer, sheet_name='All Customers', index=False)
-            
-            # Per quadrant
-            for quadrant in df['sales_quadrant'].unique():
-                quad_df = df[df['sales_quadrant'] == quadrant]
-                sheet_name = quadrant[:31]
-                quad_df.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            # Top opportunities
-            top_opp = df.nlargest(100, 'confidence_score')
-            top_opp.to_excel(writer, sheet_name='Top 100 Opportunities', index=False)
+    @staticmethod
+    def _top_n(df: pd.DataFrame, col: str, n: int) -> pd.DataFrame:
+        """Top-n baris menurut col via np.partition (tanpa sort seluruh kolom)
         
-        print(f"   Excel: {excel_path}")
+        Himpunan baris sama dengan nlargest(keep='first'): seri diambil dari baris paling awal.
+        Urutan baris yang nilainya sama mengikuti urutan baris asli, sedangkan urutan seri
+        nlargest tidak dijamin. confidence_score hanya punya beberapa nilai, jadi urutan sheet
+        Top 100 bisa berbeda dari versi nlargest (isi barisnya tetap sama).
+        """
+        vals = df[col].to_numpy(dtype=np.float64)
+        k = min(n, vals.size)
+        if k == 0:
+            return df.iloc[:0]
+        kth = np.partition(vals, vals.size - k)[vals.size - k]
+        above = np.flatnonzero(vals > kth)
+        ties = np.flatnonzero(vals == kth)[:k - above.size]
+        idx = np.sort(np.concatenate([above, ties]))
+        return df.iloc[idx[np.argsort(-vals[idx], kind='stable')]]
+    
+    def _export_results(self, df: pd.DataFrame, sales_counts: Dict = None, trust_counts: Dict = None):
+        """Export hasil untuk dashboard (counts kuadran dari run_pipeline bila tersedia)"""
+        if sales_counts is None:
+            sales_counts = df['sales_quadrant'].value_counts().to_dict()
+        if trust_counts is None:
+            trust_counts = df['trust_quadrant'].value_counts().to_dict()
+        
+        # Excel Master (opsional; Parquet di bawah jauh lebih cepat untuk dashboard)
+        if self.export_excel:
+            excel_path = os.path.join(self.output_dir, 'CVO_v5_Master_Analysis.xlsx')
+            with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+                # All customers
+                df.to_excel(writer, sheet_name='All Customers', index=False)
+                
+                # Per quadrant (satu pass groupby; urutan sheet = urutan kemunculan)
+                for quadrant, quad_df in df.groupby('sales_quadrant', sort=False, observed=True):
+                    sheet_name = quadrant[:31]
+                    quad_df.to_excel(writer, sheet_name=sheet_name, index=False)
+                
+                # Top opportunities
+                top_opp = self._top_n(df, 'confidence_score', 100)
+                top_opp.to_excel(writer, sheet_name='Top 100 Opportunities', index=False)
+            
+            print(f"   Excel: {excel_path}")
         
         # JSON untuk Dashboard
         dashboard_dir = os.path.join(self.output_dir, 'dashboard_data')
@@ -452,25 +635,32 @@ class CVOPipeline:
             'total_ltv': float(df['ltv'].sum()),
             'avg_revenue': float(df['monthly_revenue'].mean()),
             'avg_ltv': float(df['ltv'].mean()),
-            'sales_matrix': df['sales_quadrant'].value_counts().to_dict(),
-            'trust_matrix': df['trust_quadrant'].value_counts().to_dict(),
+            'sales_matrix': sales_counts,
+            'trust_matrix': trust_counts,
             'generated_at': datetime.now().isoformat()
         }
         
-        with open(f'{dashboard_dir}/summary_v5.json', 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        _dump_json(summary, f'{dashboard_dir}/summary_v5.json')
         
         # Customers data
-        customers_export = df[[
-            'idPelanggan', 'namaPelanggan', 'segmenCustomer', 'monthly_revenue', 
-            'bandwidth_mbps', 'bandwidth_cluster', 'tenure_years', 'tenure_cluster',
-            'ltv', 'sales_quadrant', 'sales_strategy', 'trust_quadrant', 'trust_strategy',
-            'recommendation_primary', 'recommendation_secondary', 'recommendation_reasoning',
-            'confidence_score', 'sales_color'
-        ]].to_dict('records')
-        
-        with open(f'{dashboard_dir}/customers_v5.json', 'w', encoding='utf-8') as f:
-            json.dump(customers_export, f, indent=2, ensure_ascii=False)
+        customers_df = df[list(self.CUSTOMER_EXPORT_COLS)]
+        
+        # Parquet kolumnar (dibaca dashboard via Arrow/DuckDB)
+        if PYARROW_AVAILABLE:
+            parquet_path = f'{dashboard_dir}/customers_v5.parquet'
+            try:
+                customers_df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+            except Exception as e:
+                # Kolom campuran (angka + teks) tidak bisa disimpan ke Parquet
+                print(f"   [WARN] Parquet gagal, hanya JSON: {e}")
+                if os.path.exists(parquet_path):
+                    os.remove(parquet_path)
+        
+        # Per kolom ke list skalar Python, lalu satu dict per baris (tanpa itertuples + boxing per sel)
+        columns = [customers_df[col].tolist() for col in self.CUSTOMER_EXPORT_COLS]
+        customers_export = [dict(zip(self.CUSTOMER_EXPORT_COLS, row)) for row in zip(*columns)]
+        
+        _dump_json(customers_export, f'{dashboard_dir}/customers_v5.json', indent=False)
         
         print(f"   JSON files in: {dashboard_dir}")
 
@@ -0,0 +1,91 @@
+"""
+CVO - Helper I/O Excel bersama untuk skrip src/ml
+=================================================
+Baca Excel dengan cache Parquet (engine calamine bila tersedia),
+tulis workbook multi-sheet, dan downcast kolom angka bulat.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import xlsxwriter  # noqa: F401
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    import python_calamine  # noqa: F401  engine 'calamine' untuk pd.read_excel, baru ada sejak pandas 2.2
+    CALAMINE_AVAILABLE = tuple(int(v) for v in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401  engine untuk cache Parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def read_excel_cached(path, cache_path, **kwargs):
+    """pd.read_excel dengan cache Parquet; cache dipakai selama tidak lebih tua dari file sumber"""
+    if PYARROW_AVAILABLE and os.path.exists(cache_path) \
+            and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        try:
+            df = pd.read_parquet(cache_path, engine='pyarrow')
+            # Parquet mengembalikan None untuk sel kosong di kolom teks; samakan dengan read_excel (NaN)
+            obj_cols = df.columns[df.dtypes == object]
+            df[obj_cols] = df[obj_cols].where(df[obj_cols].notna(), np.nan)
+            print(f"   Cache Parquet dipakai: {cache_path}")
+            return df
+        except Exception as e:
+            print(f"   [WARN] Cache Parquet tidak terbaca, baca ulang Excel: {e}")
+
+    df = pd.read_excel(path, engine='calamine' if CALAMINE_AVAILABLE else 'openpyxl', **kwargs)
+
+    if PYARROW_AVAILABLE:
+        try:
+            df.to_parquet(cache_path, engine='pyarrow', compression='zstd', index=False)
+        except Exception as e:
+            # Kolom campuran (angka + teks) tidak bisa disimpan ke Parquet
+            print(f"   [WARN] Cache Parquet dilewati: {e}")
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+    return df
+
+
+def downcast_integer(df, cols):
+    """Downcast ke integer terkecil bila semua nilai bulat (lossless); selain itu tetap float64
+    
+    Kolom pecahan sengaja tidak diturunkan ke float32: sum/mean float32 menggeser total revenue.
+    """
+    for col in cols:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+
+
+def write_sheets(path, sheets):
+    """Tulis pasangan (nama_sheet, DataFrame) ke satu workbook
+    
+    Pakai xlsxwriter bila ada; jika tidak, openpyxl mode write_only (streaming).
+    """
+    if XLSXWRITER_AVAILABLE:
+        # Opsi constant_memory tidak bisa dipakai: pandas menulis sel per kolom,
+        # sedangkan xlsxwriter di mode itu membuang sel dari baris yang sudah di-flush
+        with pd.ExcelWriter(path, engine='xlsxwriter',
+                            engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
+            for sheet_name, frame in sheets:
+                frame.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
+    
+    # Writer openpyxl milik pandas tidak mendukung sheet write_only (tanpa .cell()), jadi baris di-append langsung
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    for sheet_name, frame in sheets:
+        ws = wb.create_sheet(sheet_name)
+        ws.append([str(col) for col in frame.columns])
+        for row in frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(path)
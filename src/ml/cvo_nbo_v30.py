@@ -17,15 +17,28 @@ import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor, GradientBoostingClassifier
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import classification_report, roc_auc_score
+try:
+    import pyarrow  # backend for DataFrame.to_feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 import warnings
 from datetime import datetime
 import re
 import os
+import io
+import sys
 import json
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from xml.sax.saxutils import escape
 from difflib import get_close_matches
 
+from cvo_excel_io import write_sheets
+
 warnings.filterwarnings('ignore')
 
 print("="*80)
@@ -34,6 +47,213 @@ print("PLN Icon+ - Sistem Rekomendasi ML dengan NBO")
 print("="*80)
 
 
+def _copy_on_write():
+    """Context Copy-on-Write pandas (>= 2.0) agar tahap pipeline tidak menyalin frame"""
+    try:
+        pd.get_option('mode.copy_on_write')
+    except (KeyError, pd.errors.OptionError):
+        return nullcontext()
+    return pd.option_context('mode.copy_on_write', True)
+
+
+_XLSX_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_XLSX_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_XLSX_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_XLSX_CT = 'application/vnd.openxmlformats-officedocument.spreadsheetml'
+_XLSX_STATIC_PARTS = {
+    '[Content_Types].xml': (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        f'<Override PartName="/xl/workbook.xml" ContentType="{_XLSX_CT}.sheet.main+xml"/>'
+        f'<Override PartName="/xl/worksheets/sheet1.xml" ContentType="{_XLSX_CT}.worksheet+xml"/>'
+        f'<Override PartName="/xl/sharedStrings.xml" ContentType="{_XLSX_CT}.sharedStrings+xml"/>'
+        '</Types>'),
+    '_rels/.rels': (
+        f'<Relationships xmlns="{_XLSX_PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'),
+    'xl/workbook.xml': (
+        f'<workbook xmlns="{_XLSX_MAIN_NS}" xmlns:r="{_XLSX_REL_NS}">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+    'xl/_rels/workbook.xml.rels': (
+        f'<Relationships xmlns="{_XLSX_PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+        f'<Relationship Id="rId2" Type="{_XLSX_REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+        '</Relationships>'),
+}
+_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_XML_ILLEGAL_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _xlsx_cell(value, shared_strings):
+    """Fragmen XML <c> untuk satu nilai (string masuk tabel sharedStrings)"""
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return f'<c><v>{value:.16g}</v></c>' if np.isfinite(value) else '<c/>'
+    idx = shared_strings.setdefault(str(value), len(shared_strings))
+    return f'<c t="s"><v>{idx}</v></c>'
+
+
+def _xlsx_column_cells(series, shared_strings):
+    """Fragmen <c> per baris untuk satu kolom, tanpa dispatch per sel lewat pandas"""
+    # Jalur cepat hanya untuk dtype NumPy; dtype nullable (Int64/boolean/Float64) bisa berisi
+    # pd.NA dan lewat jalur factorize di bawah (NA -> sel kosong)
+    if isinstance(series.dtype, np.dtype):
+        if pd.api.types.is_bool_dtype(series.dtype):
+            return [f'<c t="b"><v>{int(v)}</v></c>' for v in series.tolist()]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            return [f'<c><v>{v}</v></c>' for v in series.tolist()]
+        if pd.api.types.is_float_dtype(series.dtype):
+            return [f'<c><v>{v:.16g}</v></c>' if np.isfinite(v) else '<c/>' for v in series.tolist()]
+    # Strings/categories/nullable: one fragment per distinct value, then gather by factorize codes
+    codes, uniques = pd.factorize(series)
+    fragments = [_xlsx_cell(u, shared_strings) for u in uniques] + ['<c/>']
+    return np.array(fragments, dtype=object)[codes]
+
+
+def _fast_write_xlsx(path, df):
+    """Tulis df ke XLSX satu sheet langsung sebagai XML (tanpa to_excel per sel)"""
+    shared_strings = {}
+    header = ''.join(_xlsx_cell(str(col), shared_strings) for col in df.columns)
+    columns = [_xlsx_column_cells(df[col], shared_strings) for col in df.columns]
+    
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, xml in _XLSX_STATIC_PARTS.items():
+            zf.writestr(name, _XML_DECL + xml)
+        
+        with io.BufferedWriter(zf.open('xl/worksheets/sheet1.xml', 'w'), buffer_size=1 << 20) as f:
+            f.write(f'{_XML_DECL}<worksheet xmlns="{_XLSX_MAIN_NS}"><sheetData>'
+                    f'<row r="1">{header}</row>'.encode('utf-8'))
+            for r, cells in enumerate(zip(*columns), start=2):
+                f.write(f'<row r="{r}">{"".join(cells)}</row>'.encode('utf-8'))
+            f.write(b'</sheetData></worksheet>')
+        
+        with io.BufferedWriter(zf.open('xl/sharedStrings.xml', 'w'), buffer_size=1 << 20) as f:
+            f.write(f'{_XML_DECL}<sst xmlns="{_XLSX_MAIN_NS}" uniqueCount="{len(shared_strings)}">'
+                    .encode('utf-8'))
+            for text in shared_strings:
+                text = escape(_XML_ILLEGAL_RE.sub('', text))
+                f.write(f'<si><t xml:space="preserve">{text}</t></si>'.encode('utf-8'))
+            f.write(b'</sst>')
+
+
+def _write_csv_sidecar(df, xlsx_path):
+    """Salinan .csv.gz dari laporan tanpa styling (jauh lebih cepat dibaca/ditulis dari XLSX)"""
+    df.to_csv(xlsx_path.replace('.xlsx', '.csv.gz'), index=False, compression='gzip')
+
+
+def _write_master_report(df_exp, path, csv_only=False):
+    """Master report: seluruh pelanggan, urut skor upsell"""
+    df_sorted = df_exp.sort_values('Skor Upsell (0-1)', ascending=False)
+    _write_csv_sidecar(df_sorted, path)
+    if not csv_only:
+        _fast_write_xlsx(path, df_sorted)
+
+
+_SHEET_INVALID_RE = re.compile(r'[\[\]:*?/\\]')
+
+
+def _safe_sheet_name(name, used):
+    """Nama sheet Excel yang valid dan unik dalam satu workbook (maks 31 karakter)"""
+    base = _SHEET_INVALID_RE.sub('_', str(name))[:31] or 'Sheet'
+    candidate, n = base, 1
+    while candidate.lower() in used:  # Excel compares sheet names case-insensitively
+        suffix = f'_{n}'
+        candidate = base[:31 - len(suffix)] + suffix
+        n += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def _write_grouped_report(df_exp, group_col, path):
+    """Satu sheet per nilai group_col"""
+    used = set()
+    write_sheets(path, ((_safe_sheet_name(key, used), sub)
+                         for key, sub in df_exp.groupby(group_col, sort=False, observed=True)))
+
+
+def _write_sorted_report(df, by, ascending, path, csv_only=False):
+    """Satu sheet, diurutkan menurut by"""
+    df_sorted = df.sort_values(by, ascending=ascending, kind='stable')
+    _write_csv_sidecar(df_sorted, path)
+    if not csv_only:
+        write_sheets(path, [('Sheet1', df_sorted)])
+
+
+# Bandwidth clusters ordered by capacity; UNKNOWN = unparseable Bandwidth Fix
+BANDWIDTH_CLUSTER_DTYPE = pd.CategoricalDtype(
+    ['UNKNOWN', 'NO_BANDWIDTH', 'ATM_IOT', 'UMKM_SMALL', 'CORPORATE', 'ENTERPRISE'], ordered=True)
+
+# Columns read by generate_executive_summary
+SUMMARY_COLS = ('nama_pelanggan', 'bandwidth_cluster', 'tier', 'kuadran', 'pendapatan',
+                'bandwidth_mbps', 'skor_upsell', 'potensi_revenue', 'nbo_recommendation')
+
+# Label columns the reports group/filter on
+REPORT_CATEGORICAL_COLS = ('bandwidth_cluster', 'segmen', 'kuadran', 'tier')
+
+
+def _as_categorical(df, cols=REPORT_CATEGORICAL_COLS):
+    """Pastikan kolom label bertipe category (no-op bila sudah)"""
+    for col in cols:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def format_rp_vec(values):
+    """Format array Rupiah (T/M/Jt) sekaligus; sama dengan format_rp per nilai"""
+    values = np.asarray(values, dtype=np.float64)
+    conditions = [values >= 1e12, values >= 1e9, values >= 1e6]
+    scales = np.select(conditions, [1e12, 1e9, 1e6], default=1.0)
+    suffixes = np.select(conditions, ['T', 'M', 'Jt'], default='')
+    return [f"Rp {v / scale:.2f} {suffix}" if suffix else f"Rp {v:,.0f}"
+            for v, scale, suffix in zip(values.tolist(), scales.tolist(), suffixes.tolist())]
+
+
+def _top_k_positions(values, k):
+    """Posisi k nilai terbesar tanpa sort penuh (urutan & seri sama dengan nlargest)"""
+    values = np.asarray(values, dtype=np.float64)
+    nan_mask = np.isnan(values)
+    positions = np.flatnonzero(~nan_mask)
+    if len(positions) > k:
+        vals = values[positions]
+        kth = np.partition(vals, len(vals) - k)[len(vals) - k]
+        above = positions[vals > kth]
+        ties = positions[vals == kth][:k - len(above)]
+        positions = np.concatenate([above, ties])
+    positions = positions[np.lexsort((positions, -values[positions]))]
+    if len(positions) < k:  # like nlargest, pad with NaN rows
+        positions = np.concatenate([positions, np.flatnonzero(nan_mask)[:k - len(positions)]])
+    return positions
+
+
+# Tiers in the Tier_Roadmap report, in roadmap order (sorted as int codes)
+HIGH_PRIORITY_TIER_DTYPE = pd.CategoricalDtype(
+    ['DI Only', 'TS Only', 'DI-TS', 'SDS-TS', 'GE-SDS-TS'], ordered=True)
+
+# Tier components as bit flags, e.g. 'DI-TS' -> DI | TS
+TIER_DI, TIER_TS, TIER_SDS, TIER_GE = 8, 4, 2, 1
+_TIER_COMPONENT_BITS = (('DI', TIER_DI), ('TS', TIER_TS), ('SDS', TIER_SDS), ('GE', TIER_GE))
+_GOV_PRODUCT_RE = re.compile(r'ap2t|ago|smart city|public')
+
+# ML feature columns, in model order; only the ones present in the data are used
+FEATURE_CANDIDATES = (
+    'pendapatan', 'bandwidth_mbps', 'masa_berlangganan',
+    'pendapatan_per_mbps', 'pertumbuhan_pendapatan', 'skor_nilai',
+    'high_value', 'bandwidth_cluster_encoded',
+    'segmen_encoded', 'tier_encoded', 'kategori_encoded',
+)
+
+
+def tier_mask(tier):
+    """Bitmask komponen tier (DI/TS/SDS/GE); 0 untuk tier kosong"""
+    if not isinstance(tier, str):
+        return 0
+    return sum(bit for component, bit in _TIER_COMPONENT_BITS if component in tier)
+
+
 class ProductCatalog:
     """Katalog Produk Icon+ untuk rekomendasi NBO"""
     
@@ -42,6 +262,8 @@ class ProductCatalog:
         self.df_catalog = None
         self.product_hierarchy = {}
         self.tier_products = {}
+        self._tier_masks = {tier: tier_mask(tier) for tier in TierRoadmap.TIER_ROADMAP}
+        self._cross_sell_cache = {}
         self.load_catalog()
     
     def load_catalog(self):
@@ -111,6 +333,7 @@ class ProductCatalog:
             'SDS': [],     # Smart Digital Solution products
             'GE': []       # Green Ecosystem products
         }
+        self._cross_sell_cache = {}
         
         for idx, row in self.df_catalog.iterrows():
             nomenklatur = str(row.get('Nomenklatur Baru', ''))
@@ -155,30 +378,42 @@ class ProductCatalog:
     
     def get_cross_sell_by_tier(self, current_tier, segmen='BUSINESS'):
         """Get cross-sell product recommendations based on tier and segment"""
+        mask = self._tier_masks.get(current_tier)
+        if mask is None:
+            mask = tier_mask(current_tier)
+        
+        # Result only depends on (mask, segmen): compute once per pair
+        key = (mask, segmen)
+        if key not in self._cross_sell_cache:
+            self._cross_sell_cache[key] = self._cross_sell_for_mask(mask, segmen)
+        return list(self._cross_sell_cache[key])
+    
+    def _cross_sell_for_mask(self, mask, segmen):
+        """Cross-sell recommendations for a tier bitmask"""
         recommendations = []
         
         # Parse current tier
-        has_di = 'DI' in current_tier
-        has_ts = 'TS' in current_tier
-        has_sds = 'SDS' in current_tier
-        has_ge = 'GE' in current_tier
+        has_di = mask & TIER_DI
+        has_ts = mask & TIER_TS
+        has_sds = mask & TIER_SDS
+        has_ge = mask & TIER_GE
         
         # Recommend next tier
-        if not has_ts and 'DI' in current_tier:
+        if not has_ts and has_di:
             # DI Only or DI-SDS, DI-GE → add TS
             recommendations.extend(self.tier_products.get('TS', [])[:3])
         
-        if not has_sds and 'DI' in current_tier and 'TS' in current_tier:
+        if not has_sds and has_di and has_ts:
             # DI-TS → add SDS
             recommendations.extend(self.tier_products.get('SDS', [])[:3])
         
-        if not has_ge and ('SDS' in current_tier or 'TS' in current_tier):
+        if not has_ge and (has_sds or has_ts):
             # Add GE for high-tier customers
             recommendations.extend(self.tier_products.get('GE', [])[:2])
         
         # Contextual by segment
         if segmen == 'GOVERNMENT':
-            gov_products = [p for p in recommendations if any(x in p.lower() for x in ['ap2t', 'ago', 'smart city', 'public'])]
+            gov_products = [p for p in recommendations if _GOV_PRODUCT_RE.search(p.lower())]
             if gov_products:
                 recommendations = gov_products + recommendations
         
@@ -235,6 +470,12 @@ class CustomerValueOptimizerNBO:
         self.label_encoders = {}
         self.metrics = {'upsell': {}, 'crosssell': {}, 'clv': {}}
         self.thresholds = {}
+        self.feature_cols = None
+        self._X_all_scaled = None
+        self._X_all_key = None
+        self._X_all_frame = None
+        self._hp_mask = None
+        self._vhp_mask = None
         
         if catalog_path:
             self.product_catalog = ProductCatalog(catalog_path)
@@ -308,8 +549,6 @@ class CustomerValueOptimizerNBO:
             print("   [ERROR] No data loaded. Please load data first.")
             return None
         
-        df = self.df_raw.copy()
-        
         # Column mapping
         column_mapping = {
             'namaPelanggan': 'nama_pelanggan',
@@ -325,41 +564,53 @@ class CustomerValueOptimizerNBO:
             'statusLayanan': 'status'
         }
         
-        for old_col, new_col in column_mapping.items():
-            if old_col in df.columns:
-                df.rename(columns={old_col: new_col}, inplace=True)
+        # rename() returns a new frame, so df_raw stays untouched without a full copy
+        df = self.df_raw.rename(columns=column_mapping)
         
-        # Clean revenue
+        # Clean revenue: parse numerically first, strip non-digits only on the leftovers
         for col in ['pendapatan', 'pendapatan_sebelumnya']:
             if col in df.columns:
-                df[col] = df[col].astype(str).str.replace(r'[^\d]', '', regex=True)
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                num = pd.to_numeric(df[col], errors='coerce')
+                perlu_bersih = num.isna() & df[col].notna()
+                if perlu_bersih.any():
+                    num.loc[perlu_bersih] = pd.to_numeric(
+                        df.loc[perlu_bersih, col].astype(str).str.replace(r'[^\d]', '', regex=True),
+                        errors='coerce')
+                df[col] = num.fillna(0)
         
         # Parse Bandwidth Fix - KRITIS
         if 'bandwidth_fix' in df.columns:
             print("   [SEARCH] Parsing Bandwidth Fix...")
             bw_data = df['bandwidth_fix'].apply(self.parse_bandwidth_fix)
             df['bandwidth_mbps'] = bw_data.apply(lambda x: x[0])
-            df['bandwidth_cluster'] = bw_data.apply(lambda x: x[1])
+            df['bandwidth_cluster'] = bw_data.apply(lambda x: x[1]).astype(BANDWIDTH_CLUSTER_DTYPE)
             
             # Show distribution
             cluster_dist = df['bandwidth_cluster'].value_counts()
+            cluster_dist = cluster_dist[cluster_dist > 0]
+            cluster_table = pd.DataFrame({'count': cluster_dist, 'pct': cluster_dist / len(df) * 100})
             print("\n   [DATA] Distribusi Bandwidth Cluster:")
-            for cluster, count in cluster_dist.items():
-                pct = count / len(df) * 100
-                print(f"      {cluster:15s}: {count:>6,} pelanggan ({pct:>5.1f}%)")
+            print("\n".join(f"      {cluster:15s}: {count:>6,} pelanggan ({pct:>5.1f}%)"
+                            for cluster, count, pct in cluster_table.itertuples()))
         
         # Clean tenure
         df['masa_berlangganan'] = pd.to_numeric(df.get('masa_berlangganan', 0), errors='coerce').fillna(0)
         
-        # Filter active only
+        # Filter active only: match the few distinct status labels, then filter rows by code
         if 'status' in df.columns:
-            df = df[df['status'].str.contains('AKTIF|Aktif|Active', case=False, na=False)]
+            status = df['status'].astype('category')
+            kategori_aktif = status.cat.categories.astype(str).str.contains('aktif|active', case=False)
+            df = df[np.isin(status.cat.codes.to_numpy(), np.flatnonzero(kategori_aktif))]
         
         # Remove duplicates
         if 'nama_pelanggan' in df.columns:
             df = df.drop_duplicates(subset=['nama_pelanggan'], keep='first')
         
+        # Low-cardinality labels as categoricals: groupby/== work on int codes
+        for col in ['segmen', 'tier']:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
         self.df_processed = df
         print(f"[OK] Data dibersihkan: {len(df):,} pelanggan aktif")
         return df
@@ -367,7 +618,7 @@ class CustomerValueOptimizerNBO:
     def engineer_features(self):
         """Membuat fitur untuk model ML dengan NBO"""
         print("\n[FIX] Membuat fitur ML...")
-        df = self.df_processed.copy()
+        df = self.df_processed
         
         # Tier analysis
         if 'tier' in df.columns:
@@ -376,21 +627,28 @@ class CustomerValueOptimizerNBO:
             print(f"      Total {len(tier_dist)} kombinasi tier ditemukan")
             
             # Add tier recommendation
-            df['tier_recommendation'] = df['tier'].apply(
+            # tier is categorical; apply on object values so the results stay plain strings
+            tier = df['tier'].astype(object)
+            df['tier_recommendation'] = tier.apply(
                 lambda x: TierRoadmap.get_recommendation(x)['action'] if pd.notna(x) else 'Unknown'
             )
-            df['tier_priority'] = df['tier'].apply(
+            df['tier_priority'] = tier.apply(
                 lambda x: TierRoadmap.get_recommendation(x)['priority'] if pd.notna(x) else 'UNKNOWN'
             )
         
-        # Revenue features per cluster
-        df['pendapatan_per_mbps'] = np.where(df['bandwidth_mbps'] > 0, 
-                                              df['pendapatan'] / df['bandwidth_mbps'], 0)
+        # Revenue features per cluster (divide only where the denominator is positive)
+        pendapatan = df['pendapatan'].to_numpy(dtype=np.float64)
+        bw = df['bandwidth_mbps'].to_numpy(dtype=np.float64)
+        per_mbps = np.zeros(len(df), dtype=np.float32)
+        np.divide(pendapatan, bw, out=per_mbps, where=bw > 0)
+        df['pendapatan_per_mbps'] = per_mbps
         
         # Growth
         if 'pendapatan_sebelumnya' in df.columns:
-            df['pertumbuhan_pendapatan'] = np.where(df['pendapatan_sebelumnya'] > 0,
-                                                   (df['pendapatan'] - df['pendapatan_sebelumnya']) / df['pendapatan_sebelumnya'], 0)
+            sebelumnya = df['pendapatan_sebelumnya'].to_numpy(dtype=np.float64)
+            pertumbuhan = np.zeros(len(df), dtype=np.float32)
+            np.divide(pendapatan - sebelumnya, sebelumnya, out=pertumbuhan, where=sebelumnya > 0)
+            df['pertumbuhan_pendapatan'] = pertumbuhan
         else:
             df['pertumbuhan_pendapatan'] = 0
         
@@ -407,25 +665,27 @@ class CustomerValueOptimizerNBO:
             
             return (pendapatan_norm * 0.5 + tenure_norm * 0.3 + bw_norm * 0.2)
         
-        df['skor_nilai'] = df.groupby('bandwidth_cluster', group_keys=False).apply(calc_value_score)
+        df['skor_nilai'] = df.groupby('bandwidth_cluster', observed=True, group_keys=False).apply(calc_value_score)
         
         # High value indicators per cluster
-        df['high_value'] = df.groupby('bandwidth_cluster')['pendapatan'].transform(
+        df['high_value'] = df.groupby('bandwidth_cluster', observed=True)['pendapatan'].transform(
             lambda x: (x >= x.quantile(0.75)).astype(int) if len(x) > 0 else 0)
         
-        df['high_bandwidth'] = df.groupby('bandwidth_cluster')['bandwidth_mbps'].transform(
+        df['high_bandwidth'] = df.groupby('bandwidth_cluster', observed=True)['bandwidth_mbps'].transform(
             lambda x: (x >= x.quantile(0.75)).astype(int) if len(x) > 0 else 0)
         
-        # Encode categorical
+        # Encode categorical (dtype kept so codes can be mapped back to labels)
         for col in ['segmen', 'wilayah', 'kategori', 'tier']:
             if col in df.columns:
-                le = LabelEncoder()
-                df[f'{col}_encoded'] = le.fit_transform(df[col].astype(str))
-                self.label_encoders[col] = le
+                kategori_col = df[col].astype('category')
+                df[f'{col}_encoded'] = kategori_col.cat.codes.astype(np.int16)
+                self.label_encoders[col] = kategori_col.dtype
         
         # Encode bandwidth cluster
-        le_bw = LabelEncoder()
-        df['bandwidth_cluster_encoded'] = le_bw.fit_transform(df['bandwidth_cluster'])
+        df['bandwidth_cluster_encoded'] = df['bandwidth_cluster'].cat.codes.astype(np.int16)
+        self.label_encoders['bandwidth_cluster'] = BANDWIDTH_CLUSTER_DTYPE
+        
+        self.feature_cols = [c for c in FEATURE_CANDIDATES if c in df.columns]
         
         self.df_features = df
         print(f"[OK] Fitur siap: {df.shape[1]} kolom")
@@ -434,21 +694,17 @@ class CustomerValueOptimizerNBO:
     def create_strategic_matrices(self):
         """Membuat matriks strategis dengan NBO"""
         print("\n[DATA] Membuat matriks strategis dengan NBO...")
-        df = self.df_features.copy()
+        df = self.df_features
         
         # Calculate thresholds per bandwidth cluster
         print("    Menghitung threshold per bandwidth cluster...")
-        cluster_thresholds = {}
-        
-        for cluster in df['bandwidth_cluster'].unique():
-            cluster_data = df[df['bandwidth_cluster'] == cluster]
-            if len(cluster_data) > 0:
-                cluster_thresholds[cluster] = {
-                    'median_pendapatan': cluster_data['pendapatan'].median(),
-                    'median_bandwidth': cluster_data['bandwidth_mbps'].median(),
-                    'q75_pendapatan': cluster_data['pendapatan'].quantile(0.75),
-                    'q25_pendapatan': cluster_data['pendapatan'].quantile(0.25)
-                }
+        per_cluster = df.groupby('bandwidth_cluster', observed=True)
+        cluster_thresholds = pd.DataFrame({
+            'median_pendapatan': per_cluster['pendapatan'].median(),
+            'median_bandwidth': per_cluster['bandwidth_mbps'].median(),
+            'q75_pendapatan': per_cluster['pendapatan'].quantile(0.75),
+            'q25_pendapatan': per_cluster['pendapatan'].quantile(0.25)
+        }).to_dict('index')
         
         self.thresholds = cluster_thresholds
         
@@ -501,7 +757,7 @@ class CustomerValueOptimizerNBO:
             return ' UNKNOWN', 'ANALYZE'
         
         hasil = df.apply(classify_customer, axis=1)
-        df['kuadran'] = hasil.apply(lambda x: x[0])
+        df['kuadran'] = hasil.apply(lambda x: x[0]).astype('category')
         df['strategi'] = hasil.apply(lambda x: x[1])
         
         # Add NBO recommendations
@@ -545,43 +801,48 @@ class CustomerValueOptimizerNBO:
         # Display distribution
         print("\n   [DATA] Distribusi Kuadran Strategis:")
         print("   " + "="*80)
-        kuadran_dist = df['kuadran'].value_counts()
-        for kuadran, count in kuadran_dist.items():
-            pct = count / len(df) * 100
-            revenue = df[df['kuadran'] == kuadran]['pendapatan'].sum()
-            print(f"   {kuadran:25s}: {count:>6,} pel ({pct:>5.1f}%) | Rev: Rp {revenue:>12,.0f}")
+        kuadran_table = (df.groupby('kuadran', observed=True)['pendapatan'].agg(['count', 'sum'])
+                         .sort_values('count', ascending=False, kind='stable'))
+        kuadran_table['pct'] = kuadran_table['count'] / len(df) * 100
+        print("\n".join(f"   {kuadran:25s}: {count:>6,} pel ({pct:>5.1f}%) | Rev: Rp {revenue:>12,.0f}"
+                        for kuadran, count, revenue, pct in kuadran_table.itertuples()))
         print("   " + "="*80)
         
         return df
     
+    def _scaled_cache_key(self, df):
+        """Key for the cached scaled matrix: frame identity + shape + feature set"""
+        return (id(df), df.shape, tuple(self.feature_cols))
+    
+    def _scaled_cache_valid(self, df):
+        """True if the matrix cached by train_models was built from this exact frame"""
+        return (self._X_all_scaled is not None and self._X_all_frame is df
+                and self._X_all_key == self._scaled_cache_key(df))
+    
     def train_models(self):
         """Melatih model ML untuk eligible segments"""
         print("\n[TARGET] Melatih model ML...")
-        df = self.df_features.copy()
+        df = self.df_features
         
         # Only train on CORPORATE and UMKM (eligible for upsell)
-        eligible_mask = df['bandwidth_cluster'].isin(['CORPORATE', 'UMKM_SMALL'])
-        df_eligible = df[eligible_mask].copy()
+        eligible_mask = df['bandwidth_cluster'].isin(['CORPORATE', 'UMKM_SMALL']).to_numpy()
+        df_eligible = df[eligible_mask]
         
         if len(df_eligible) < 100:
             print("   [WARN]  Data eligible terlalu sedikit, menggunakan semua data...")
-            df_eligible = df.copy()
+            eligible_mask = np.ones(len(df), dtype=bool)
+            df_eligible = df
         
         print(f"   [DATA] Training set: {len(df_eligible):,} pelanggan eligible")
         
-        # Features
-        feature_cols = ['pendapatan', 'bandwidth_mbps', 'masa_berlangganan', 
-                       'pendapatan_per_mbps', 'pertumbuhan_pendapatan', 'skor_nilai',
-                       'high_value', 'bandwidth_cluster_encoded']
-        
-        for col in ['segmen_encoded', 'tier_encoded', 'kategori_encoded']:
-            if col in df.columns:
-                feature_cols.append(col)
-        
-        feature_cols = [c for c in feature_cols if c in df.columns]
-        
-        X = df_eligible[feature_cols].fillna(0)
-        X_scaled = self.scaler.fit_transform(X)
+        # One fillna + transform over all rows; the eligible training set is a row slice of it
+        X_all = df[self.feature_cols].fillna(0).to_numpy(dtype=np.float32, copy=False)
+        self.scaler.fit(X_all[eligible_mask])
+        X_all_scaled = self.scaler.transform(X_all)
+        self._X_all_scaled = X_all_scaled
+        self._X_all_key = self._scaled_cache_key(df)
+        self._X_all_frame = df  # keeps id(df) from being reused while cached
+        X_scaled = X_all_scaled[eligible_mask]
         
         # Targets
         y_upsell = (df_eligible['kuadran'].str.contains('SNIPER', na=False)).astype(int)
@@ -618,7 +879,7 @@ class CustomerValueOptimizerNBO:
         print("\n   [MONEY] Melatih Model CLV...")
         y_clv = df['pendapatan']
         X_tr, X_te, y_tr, y_te = train_test_split(
-            self.scaler.transform(df[feature_cols].fillna(0)), y_clv, test_size=0.2, random_state=42)
+            X_all_scaled, y_clv, test_size=0.2, random_state=42)
         
         self.clv_model = GradientBoostingRegressor(
             n_estimators=100, max_depth=4, learning_rate=0.1, random_state=42
@@ -638,27 +899,23 @@ class CustomerValueOptimizerNBO:
     def generate_predictions(self):
         """Generate predictions and NBO for all customers"""
         print("\n Generating predictions...")
-        df = self.df_features.copy()
-        
-        # Features
-        feature_cols = ['pendapatan', 'bandwidth_mbps', 'masa_berlangganan', 
-                       'pendapatan_per_mbps', 'pertumbuhan_pendapatan', 'skor_nilai',
-                       'high_value', 'bandwidth_cluster_encoded']
-        for col in ['segmen_encoded', 'tier_encoded', 'kategori_encoded']:
-            if col in df.columns:
-                feature_cols.append(col)
-        feature_cols = [c for c in feature_cols if c in df.columns]
+        df = self.df_features
         
-        X = df[feature_cols].fillna(0)
-        X_scaled = self.scaler.transform(X)
+        if self._scaled_cache_valid(df):
+            X_scaled = self._X_all_scaled
+        else:
+            X_scaled = self.scaler.transform(
+                df[self.feature_cols].fillna(0).to_numpy(dtype=np.float32, copy=False))
         
         # Predictions
         if self.upsell_model:
             df['skor_upsell'] = self.upsell_model.predict_proba(X_scaled)[:, 1]
         else:
-            # Fallback: use heuristic based on kuadran
-            df['skor_upsell'] = df['kuadran'].apply(
-                lambda x: 0.8 if 'SNIPER' in str(x) else 0.3 if 'RISIKO' in str(x) else 0.1)
+            # Fallback: use heuristic based on kuadran (from the labels as strings, always float)
+            kuadran = df['kuadran'].astype(str)
+            df['skor_upsell'] = np.select(
+                [kuadran.str.contains('SNIPER', regex=False), kuadran.str.contains('RISIKO', regex=False)],
+                [0.8, 0.3], default=0.1)
         
         df['clv_prediksi'] = self.clv_model.predict(X_scaled)
         
@@ -672,19 +929,35 @@ class CustomerValueOptimizerNBO:
                                          df['clv_prediksi'] * 0.3, 0)
         
         self.df_final = df
+        self._X_all_scaled = None  # release the cached matrix
+        self._X_all_frame = None
+        self._hp_mask = self._vhp_mask = None  # skor_upsell baru, mask lama tidak berlaku
+        hp_mask, _ = self._priority_masks()
         
         print(f"\n   [DATA] Summary:")
-        print(f"      High Priority: {(df['skor_upsell'] > 0.7).sum():,} pelanggan")
+        print(f"      High Priority: {hp_mask.sum():,} pelanggan")
         print(f"      Total Potential: Rp {df['potensi_revenue'].sum():,.0f}")
         
         return df
     
-    def generate_excel_reports(self, output_dir='laporan_nbo'):
-        """Generate comprehensive Excel reports"""
+    def _priority_masks(self):
+        """Mask skor upsell >70% dan >80% atas df_final, dihitung sekali lalu dipakai ulang"""
+        if self._hp_mask is None or len(self._hp_mask) != len(self.df_final):
+            skor = self.df_final['skor_upsell'].to_numpy()
+            self._hp_mask = skor > 0.7
+            self._vhp_mask = skor > 0.8
+        return self._hp_mask, self._vhp_mask
+    
+    def generate_excel_reports(self, output_dir='laporan_nbo', csv_only=False):
+        """Generate comprehensive Excel reports
+        
+        Master, Tier_Roadmap dan High_Priority juga ditulis sebagai .csv.gz;
+        csv_only=True melewati versi .xlsx dari ketiganya.
+        """
         os.makedirs(output_dir, exist_ok=True)
         print(f"\n[DOCS] Generating reports in '{output_dir}/'...")
         
-        df = self.df_final.copy()
+        df = _as_categorical(self.df_final.copy())
         
         # Column mapping
         col_map = {
@@ -708,50 +981,74 @@ class CustomerValueOptimizerNBO:
             'clv_prediksi': 'CLV Prediksi (Rp)'
         }
         
+        # Project + rename once; every per-group sheet below is a row slice of this
         cols = [c for c in col_map.keys() if c in df.columns]
         df_exp = df[cols].rename(columns=col_map)
         
+        # 0. Feather sidecar: typed, columnar copy for consumers that don't need Excel
+        if PYARROW_AVAILABLE:
+            try:
+                df_exp.reset_index(drop=True).to_feather(f'{output_dir}/CVO_NBO_Master.feather')
+            except Exception as e:
+                print(f"   [WARN]  Feather sidecar dilewati: {e}")
+        
+        # The workbooks are independent files: collect the jobs, then write them in parallel
+        jobs = []
+        
         # 1. Master Report
         print("   Creating Master Report...")
-        df_exp.sort_values('Skor Upsell (0-1)', ascending=False).to_excel(
-            f'{output_dir}/CVO_NBO_Master.xlsx', index=False)
+        jobs.append((_write_master_report, df_exp, f'{output_dir}/CVO_NBO_Master.xlsx', csv_only))
         
         # 2. By Bandwidth Cluster
         print("   Creating Bandwidth Cluster Analysis...")
-        with pd.ExcelWriter(f'{output_dir}/CVO_NBO_Bandwidth_Clusters.xlsx') as writer:
-            for cluster in df['bandwidth_cluster'].unique():
-                sheet_name = cluster[:31]
-                df[df['bandwidth_cluster'] == cluster][cols].rename(columns=col_map).to_excel(
-                    writer, sheet_name=sheet_name, index=False)
+        jobs.append((_write_grouped_report, df_exp, col_map['bandwidth_cluster'],
+                     f'{output_dir}/CVO_NBO_Bandwidth_Clusters.xlsx'))
         
         # 3. By Tier Roadmap
         print("   Creating Tier Roadmap...")
-        high_priority_tiers = ['DI Only', 'TS Only', 'DI-TS', 'SDS-TS', 'GE-SDS-TS']
-        tier_data = df[df['tier'].isin(high_priority_tiers)] if 'tier' in df.columns else df
-        tier_data.sort_values(['tier', 'skor_upsell'], ascending=[True, False]).to_excel(
-            f'{output_dir}/CVO_NBO_Tier_Roadmap.xlsx', index=False)
+        if 'tier' in df.columns:
+            # Match the wanted tiers on int category codes instead of hashing strings per row
+            tier_cat = df['tier'].cat
+            wanted = [tier_cat.categories.get_loc(t) for t in HIGH_PRIORITY_TIER_DTYPE.categories
+                      if t in tier_cat.categories]
+            tier_data = df[np.isin(tier_cat.codes.to_numpy(), wanted)]
+            tier_data = tier_data.assign(tier=tier_data['tier'].astype(HIGH_PRIORITY_TIER_DTYPE))
+        else:
+            tier_data = df
+        jobs.append((_write_sorted_report, tier_data, ['tier', 'skor_upsell'], [True, False],
+                     f'{output_dir}/CVO_NBO_Tier_Roadmap.xlsx', csv_only))
         
         # 4. High Priority Targets
         print("   Creating High Priority Targets...")
-        high_priority = df[df['skor_upsell'] > 0.7].sort_values('potensi_revenue', ascending=False)
-        high_priority.to_excel(f'{output_dir}/CVO_NBO_High_Priority.xlsx', index=False)
+        hp_mask, _ = self._priority_masks()
+        high_priority = df[hp_mask]
+        jobs.append((_write_sorted_report, high_priority, 'potensi_revenue', False,
+                     f'{output_dir}/CVO_NBO_High_Priority.xlsx', csv_only))
         
         # 5. By Segment
         if 'segmen' in df.columns:
             print("   Creating Segment Analysis...")
-            with pd.ExcelWriter(f'{output_dir}/CVO_NBO_by_Segment.xlsx') as writer:
-                for segmen in df['segmen'].unique():
-                    if pd.notna(segmen):
-                        sheet_name = str(segmen)[:31]
-                        df[df['segmen'] == segmen][cols].rename(columns=col_map).to_excel(
-                            writer, sheet_name=sheet_name, index=False)
+            jobs.append((_write_grouped_report, df_exp, col_map['segmen'],
+                         f'{output_dir}/CVO_NBO_by_Segment.xlsx'))
+        
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(fn, *args) for fn, *args in jobs]
+            for future in futures:
+                future.result()
         
         print(f"   [OK] Reports generated in {output_dir}/")
         return output_dir
     
     def generate_executive_summary(self, output_dir='laporan_nbo'):
         """Generate executive summary"""
-        df = self.df_final.copy()
+        # Only the columns the summary reads, not a full copy of df_final
+        df = _as_categorical(self.df_final[[c for c in SUMMARY_COLS if c in self.df_final.columns]])
+        hp_mask, vhp_mask = self._priority_masks()
+        
+        # Whole-frame totals, reduced once
+        total_rev = df['pendapatan'].sum()
+        avg_rev = total_rev / len(df) if len(df) else np.nan
+        total_potensi = df['potensi_revenue'].sum()
         
         def format_rp(angka):
             if angka >= 1e12:
@@ -763,7 +1060,7 @@ class CustomerValueOptimizerNBO:
             else:
                 return f"Rp {angka:,.0f}"
         
-        summary = f"""
+        parts = [f"""
 
            CVO v3.0 - NEXT BEST OFFER EXECUTIVE SUMMARY                        
                     PLN Icon+ - Customer Value Optimizer                       
@@ -776,62 +1073,68 @@ Generated: {datetime.now().strftime('%d %B %Y %H:%M')}
 
 
 Total Customers: {len(df):,}
-Total Revenue: {format_rp(df['pendapatan'].sum())}
-Avg Revenue/Customer: {format_rp(df['pendapatan'].mean())}
+Total Revenue: {format_rp(total_rev)}
+Avg Revenue/Customer: {format_rp(avg_rev)}
 
 
 [TARGET] BANDWIDTH CLUSTER DISTRIBUTION
 
 
-"""
+"""]
+        
+        # Per-group count/revenue/avg BW in one pass instead of one mask per statistic
+        bw_stats = df.groupby('bandwidth_cluster', observed=True).agg(
+            count=('pendapatan', 'size'), revenue=('pendapatan', 'sum'), avg_bw=('bandwidth_mbps', 'mean'))
+        kd_stats = (df.groupby('kuadran', observed=True)
+                    .agg(count=('pendapatan', 'size'), revenue=('pendapatan', 'sum'))
+                    .sort_values('count', ascending=False, kind='stable'))
+        
+        bw_stats['revenue'] = format_rp_vec(bw_stats['revenue'])
+        kd_stats['revenue'] = format_rp_vec(kd_stats['revenue'])
         
-        for cluster in ['NO_BANDWIDTH', 'ATM_IOT', 'UMKM_SMALL', 'CORPORATE', 'ENTERPRISE']:
-            if cluster in df['bandwidth_cluster'].values:
-                count = (df['bandwidth_cluster'] == cluster).sum()
-                pct = count / len(df) * 100
-                revenue = df[df['bandwidth_cluster'] == cluster]['pendapatan'].sum()
-                avg_bw = df[df['bandwidth_cluster'] == cluster]['bandwidth_mbps'].mean()
-                summary += f"{cluster:15s}: {count:>6,} pel ({pct:>5.1f}%) | {format_rp(revenue):>12s} | Avg BW: {avg_bw:>6.1f} Mbps\n"
+        clusters = [c for c in ['NO_BANDWIDTH', 'ATM_IOT', 'UMKM_SMALL', 'CORPORATE', 'ENTERPRISE']
+                    if c in bw_stats.index]
+        for cluster, count, revenue, avg_bw in bw_stats.loc[clusters].itertuples():
+            pct = count / len(df) * 100
+            parts.append(f"{cluster:15s}: {count:>6,} pel ({pct:>5.1f}%) | {revenue:>12s} | Avg BW: {avg_bw:>6.1f} Mbps\n")
         
-        summary += f"""
+        parts.append(f"""
 
 [TARGET] STRATEGIC QUADRANT DISTRIBUTION
 
 
-"""
+""")
         
-        for kuadran in df['kuadran'].value_counts().index:
-            count = (df['kuadran'] == kuadran).sum()
+        for kuadran, count, revenue in kd_stats.itertuples():
             pct = count / len(df) * 100
-            revenue = df[df['kuadran'] == kuadran]['pendapatan'].sum()
-            summary += f"{kuadran:25s}: {count:>6,} pel ({pct:>5.1f}%) | {format_rp(revenue):>12s}\n"
+            parts.append(f"{kuadran:25s}: {count:>6,} pel ({pct:>5.1f}%) | {revenue:>12s}\n")
         
-        summary += f"""
+        parts.append(f"""
 
 [LAUNCH] NEXT BEST OFFER OPPORTUNITIES
 
 
-High Priority Targets (Score >70%): {(df['skor_upsell'] > 0.7).sum():,} customers
-Total Revenue Potential: {format_rp(df['potensi_revenue'].sum())}
+High Priority Targets (Score >70%): {hp_mask.sum():,} customers
+Total Revenue Potential: {format_rp(total_potensi)}
 
 TOP 10 PRIORITY CUSTOMERS:
-"""
+""")
         
-        top10 = df.nlargest(10, 'potensi_revenue')[['nama_pelanggan', 'bandwidth_cluster', 'tier', 'kuadran', 'skor_upsell', 'potensi_revenue', 'nbo_recommendation']]
-        for idx, row in top10.iterrows():
-            summary += f"\n{row['nama_pelanggan'][:35]:35s}\n"
-            summary += f"   Cluster: {row['bandwidth_cluster']} | Tier: {row.get('tier', 'N/A')}\n"
-            summary += f"   Quadrant: {row['kuadran']} | Score: {row['skor_upsell']:.1%}\n"
-            summary += f"   Potential: {format_rp(row['potensi_revenue'])}\n"
-            summary += f"   NBO: {row['nbo_recommendation'][:60]}...\n"
+        top10 = df.iloc[_top_k_positions(df['potensi_revenue'].to_numpy(), 10)][['nama_pelanggan', 'bandwidth_cluster', 'tier', 'kuadran', 'skor_upsell', 'potensi_revenue', 'nbo_recommendation']]
+        for row in top10.to_dict('records'):
+            parts.append(f"\n{row['nama_pelanggan'][:35]:35s}\n")
+            parts.append(f"   Cluster: {row['bandwidth_cluster']} | Tier: {row.get('tier', 'N/A')}\n")
+            parts.append(f"   Quadrant: {row['kuadran']} | Score: {row['skor_upsell']:.1%}\n")
+            parts.append(f"   Potential: {format_rp(row['potensi_revenue'])}\n")
+            parts.append(f"   NBO: {row['nbo_recommendation'][:60]}...\n")
         
-        summary += f"""
+        parts.append(f"""
 
 [LIST] RECOMMENDED ACTIONS
 
 
 1. IMMEDIATE (30 Days):
-   - Contact {(df['skor_upsell'] > 0.8).sum():,} customers with score >80%
+   - Contact {vhp_mask.sum():,} customers with score >80%
    - Focus on CORPORATE SNIPER quadrant for bandwidth upsell
    - Focus on CORPORATE RISIKO quadrant for cross-sell solutions
 
@@ -869,17 +1172,20 @@ TOP 10 PRIORITY CUSTOMERS:
 
 Generated by CVO v3.0 - Next Best Offer Engine
 
-"""
+""")
+        summary = ''.join(parts)
         
-        with open(f'{output_dir}/Executive_Summary_NBO.txt', 'w', encoding='utf-8') as f:
-            f.write(summary)
+        with open(f'{output_dir}/Executive_Summary_NBO.txt', 'wb', buffering=1 << 20) as f:
+            f.write(summary.encode('utf-8'))
         
         print(f"\n[FILE] Executive Summary: {output_dir}/Executive_Summary_NBO.txt")
-        print(summary[:3000])
+        # Preview only for interactive consoles; batch runs already have the file
+        if sys.stdout.isatty():
+            sys.stdout.write(summary[:3000] + "\n")
         
         return summary
     
-    def run_pipeline(self):
+    def run_pipeline(self, csv_only=False):
         """Run complete NBO pipeline"""
         print("\n" + "="*80)
         print("CVO v3.0 - Next Best Offer Pipeline")
@@ -888,22 +1194,27 @@ Generated by CVO v3.0 - Next Best Offer Engine
         if not self.load_data():
             return False
         
-        self.clean_and_standardize()
-        self.engineer_features()
-        self.create_strategic_matrices()
-        self.train_models()
-        self.generate_predictions()
-        self.generate_excel_reports()
-        self.generate_executive_summary()
+        # Stages work on the same frame in-place; CoW keeps pandas from copying behind our back
+        with _copy_on_write():
+            self.clean_and_standardize()
+            self.engineer_features()
+            self.create_strategic_matrices()
+            self.train_models()
+            self.generate_predictions()
+            self.generate_excel_reports(csv_only=csv_only)
+            self.generate_executive_summary()
         
         print("\n" + "="*80)
         print("[OK] CVO v3.0 NBO PIPELINE COMPLETED!")
         print("="*80)
         print("\n Generated Files:")
-        print("   - CVO_NBO_Master.xlsx")
+        xlsx = "" if csv_only else ".xlsx / "
+        print(f"   - CVO_NBO_Master{xlsx}.csv.gz")
+        if PYARROW_AVAILABLE:
+            print("   - CVO_NBO_Master.feather")
         print("   - CVO_NBO_Bandwidth_Clusters.xlsx")
-        print("   - CVO_NBO_Tier_Roadmap.xlsx")
-        print("   - CVO_NBO_High_Priority.xlsx")
+        print(f"   - CVO_NBO_Tier_Roadmap{xlsx}.csv.gz")
+        print(f"   - CVO_NBO_High_Priority{xlsx}.csv.gz")
         print("   - CVO_NBO_by_Segment.xlsx")
         print("   - Executive_Summary_NBO.txt")
         
@@ -927,7 +1238,8 @@ if __name__ == "__main__":
     print(f" Catalog: {catalog_file if os.path.exists(catalog_file) else 'Not found - using default'}")
     
     cvo = CustomerValueOptimizerNBO(data_file, catalog_file if os.path.exists(catalog_file) else None)
-    success = cvo.run_pipeline()
+    # --csv-only: skip the .xlsx copies of the plain data dumps (Master, Tier_Roadmap, High_Priority)
+    success = cvo.run_pipeline(csv_only='--csv-only' in sys.argv)
     
     if success:
         print("\n[SUCCESS] Success! Check 'laporan_nbo/' folder for results.")
@@ -15,16 +15,27 @@ FITUR SMART:
 
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor, GradientBoostingClassifier
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.metrics import classification_report, roc_auc_score
 import warnings
-from datetime import datetime
 import re
 import os
 import json
-from difflib import get_close_matches
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+from cvo_excel_io import downcast_integer, read_excel_cached, write_sheets
 
 warnings.filterwarnings('ignore')
 
@@ -157,6 +168,128 @@ class SmartPatternRecognizer:
         }
     }
     
+    @classmethod
+    def _build_automaton(cls):
+        """
+        Bangun index keyword sekali per class: _KEYWORDS (urutan asli PATTERNS),
+        database Hyperscan dan/atau automaton Aho-Corasick jika library tersedia
+        """
+        cls._KEYWORDS = [(segmen, keyword, data['confidence_weight'])
+                         for segmen, data in cls.PATTERNS.items()
+                         for keyword in data['keywords']]
+        cls._KEYWORD_MAX_CONF = [min(0.99, min(0.99, weight + 0.05) + 0.03)
+                                 for _, _, weight in cls._KEYWORDS]
+        
+        # Struct-of-arrays per rank keyword untuk jalur vectorized (classify_frame)
+        segmens, keywords, weights = zip(*cls._KEYWORDS)
+        cls._KW_SEGMEN = np.array(segmens, dtype=object)
+        cls._KW_TEXT = np.array(keywords, dtype=object)
+        cls._KW_WEIGHT = np.array(weights, dtype=np.float64)
+        cls._KW_ACCURACY = np.array([cls.PATTERNS[segmen]['accuracy'] for segmen in segmens])
+        cls._KW_IS_EDUCATION = np.array(['EDUCATION' in segmen for segmen in segmens])
+        cls._KW_IS_BANKING = np.array(['BANKING' in segmen for segmen in segmens])
+        cls._HS_DB = None
+        cls._AUTOMATON = None
+        
+        # Trie karakter (node = index ke list paralel) untuk fallback tanpa library
+        cls._TRIE_CHILDREN = [{}]
+        cls._TRIE_RANKS = [()]
+        for rank, (_, keyword, _) in enumerate(cls._KEYWORDS):
+            node = 0
+            for char in keyword:
+                child = cls._TRIE_CHILDREN[node].get(char)
+                if child is None:
+                    child = len(cls._TRIE_CHILDREN)
+                    cls._TRIE_CHILDREN[node][char] = child
+                    cls._TRIE_CHILDREN.append({})
+                    cls._TRIE_RANKS.append(())
+                node = child
+            cls._TRIE_RANKS[node] += (rank,)
+        
+        cls._recognize_normalized.cache_clear()
+        
+        # Regex alternation per segmen + regex boost PT/CV per keyword,
+        # dipakai jalur vectorized (classify_frame)
+        cls._SEGMENT_RE = {
+            segmen: re.compile('|'.join(re.escape(keyword) for keyword in data['keywords']))
+            for segmen, data in cls.PATTERNS.items()
+        }
+        cls._PTCV_RE = {
+            keyword: re.compile(rf'(?:PT|CV)\s+{re.escape(keyword)}|{re.escape(keyword)}\s+(?:PT|CV)')
+            for _, keyword, _ in cls._KEYWORDS
+        }
+        
+        if HYPERSCAN_AVAILABLE:
+            try:
+                database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                database.compile(
+                    expressions=[re.escape(keyword).encode('ascii') for _, keyword, _ in cls._KEYWORDS],
+                    ids=list(range(len(cls._KEYWORDS))),
+                    elements=len(cls._KEYWORDS),
+                    flags=[0] * len(cls._KEYWORDS)
+                )
+                cls._HS_DB = database
+            except Exception as e:
+                print(f"   [WARN] Hyperscan database gagal dibuat: {e}")
+        
+        if AHOCORASICK_AVAILABLE:
+            ranks = {}
+            for rank, (_, keyword, _) in enumerate(cls._KEYWORDS):
+                ranks.setdefault(keyword, []).append(rank)
+            
+            automaton = ahocorasick.Automaton()
+            for keyword, keyword_ranks in ranks.items():
+                automaton.add_word(keyword, tuple(keyword_ranks))
+            automaton.make_automaton()
+            cls._AUTOMATON = automaton
+    
+    @classmethod
+    def _iter_keyword_hits(cls, nama):
+        """Yield (end_idx, ranks) untuk setiap kemunculan keyword di nama"""
+        # Offset Hyperscan dalam byte, jadi hanya dipakai untuk nama ASCII
+        if cls._HS_DB is not None and nama.isascii():
+            hits = []
+            cls._HS_DB.scan(
+                nama.encode('ascii'),
+                match_event_handler=lambda rank, start, end, flags, context: hits.append((end - 1, (rank,)))
+            )
+            yield from hits
+            return
+        
+        if cls._AUTOMATON is not None:
+            yield from cls._AUTOMATON.iter(nama)
+            return
+        
+        # Fallback tanpa library: jalan trie dari setiap posisi awal
+        children, ranks = cls._TRIE_CHILDREN, cls._TRIE_RANKS
+        for start in range(len(nama)):
+            node = 0
+            for end_idx in range(start, len(nama)):
+                node = children[node].get(nama[end_idx])
+                if node is None:
+                    break
+                if ranks[node]:
+                    yield end_idx, ranks[node]
+    
+    @staticmethod
+    def _is_ptcv_adjacent(nama, start, end):
+        """Cek keyword nama[start:end] diapit PT/CV (setara r'(PT|CV)\\s+KW' / r'KW\\s+(PT|CV)')"""
+        # Kiri: PT/CV lalu whitespace tepat sebelum keyword
+        if start >= 3 and nama[start - 1].isspace():
+            if nama[start - 3:start - 1] in ('PT', 'CV'):
+                return True
+            if nama[start - 2].isspace() and nama[:start].rstrip().endswith(('PT', 'CV')):
+                return True
+        
+        # Kanan: whitespace lalu PT/CV tepat sesudah keyword
+        if end + 2 < len(nama) and nama[end].isspace():
+            if nama[end + 1:end + 3] in ('PT', 'CV'):
+                return True
+            if nama[end + 1].isspace() and nama[end:].lstrip().startswith(('PT', 'CV')):
+                return True
+        
+        return False
+    
     @classmethod
     def recognize_pattern(cls, nama_pelanggan):
         """
@@ -165,32 +298,51 @@ class SmartPatternRecognizer:
         Returns:
             dict: {'segmen': str, 'confidence': float, 'matched_keyword': str, 'accuracy': float}
         """
-        nama = str(nama_pelanggan).upper().strip()
+        result = cls._recognize_normalized(str(nama_pelanggan).upper().strip())
+        return dict(result) if result else None
+    
+    @classmethod
+    @lru_cache(maxsize=100_000)
+    def _recognize_normalized(cls, nama):
+        """recognize_pattern untuk nama yang sudah dinormalisasi (di-cache, nama sering berulang)"""
+        # Satu pass atas nama: kumpulkan posisi akhir setiap kemunculan per keyword
+        hits = {}
+        for end_idx, ranks in cls._iter_keyword_hits(nama):
+            for rank in ranks:
+                hits.setdefault(rank, []).append(end_idx + 1)
         
         best_match = None
         best_confidence = 0
         matched_keyword = None
         
-        # Check semua pattern
-        for segmen, data in cls.PATTERNS.items():
-            for keyword in data['keywords']:
-                if keyword in nama:
-                    # Calculate confidence
-                    confidence = data['confidence_weight']
-                    
-                    # Boost confidence jika keyword di awal nama
-                    if nama.startswith(keyword):
-                        confidence = min(0.99, confidence + 0.05)
-                    
-                    # Boost confidence jika keyword sebelum/ sesudah PT/CV
-                    if re.search(r'(PT|CV)\s+' + re.escape(keyword), nama) or \
-                       re.search(re.escape(keyword) + r'\s+(PT|CV)', nama):
-                        confidence = min(0.99, confidence + 0.03)
-                    
-                    if confidence > best_confidence:
-                        best_confidence = confidence
-                        best_match = segmen
-                        matched_keyword = keyword
+        # Urut rank = urutan asli PATTERNS, jadi tie tetap dimenangkan keyword pertama
+        for rank in sorted(hits):
+            # Keyword yang bahkan dengan semua boost tidak bisa menang dilewati
+            if cls._KEYWORD_MAX_CONF[rank] <= best_confidence:
+                continue
+            
+            segmen, keyword, confidence = cls._KEYWORDS[rank]
+            ends = hits[rank]
+            length = len(keyword)
+            
+            # Boost confidence jika keyword di awal nama
+            if length in ends:
+                confidence = min(0.99, confidence + 0.05)
+            
+            # Boost confidence jika keyword sebelum/ sesudah PT/CV (dicek hanya jika bisa mengubah hasil)
+            boosted = min(0.99, confidence + 0.03)
+            if boosted > confidence and boosted > best_confidence and \
+               any(cls._is_ptcv_adjacent(nama, end - length, end) for end in ends):
+                confidence = boosted
+            
+            if confidence > best_confidence:
+                best_confidence = confidence
+                best_match = segmen
+                matched_keyword = keyword
+                
+                # 0.99 adalah batas atas, keyword sesudahnya tidak bisa menang
+                if best_confidence >= 0.99:
+                    break
         
         if best_match:
             return {
@@ -216,12 +368,213 @@ class SmartPatternRecognizer:
             return 'VERY_LOW'
 
 
+SmartPatternRecognizer._build_automaton()
+
+# Keluarga segmen pattern untuk cek kompatibilitas dengan segmencustomer
+_SEGMEN_FAMILY = {
+    segmen: family
+    for segmen in SmartPatternRecognizer.PATTERNS
+    for family in ('EDUCATION', 'BANKING')
+    if family in segmen
+}
+
+
+# ============================================================================
+# KATEGORI OUTPUT KLASIFIKASI
+# ============================================================================
+
+BANDWIDTH_CLUSTER_DTYPE = pd.CategoricalDtype(
+    ['NO_BANDWIDTH', 'ATM_IOT', 'UMKM_SMALL', 'CORPORATE', 'ENTERPRISE'], ordered=True)
+CONFIDENCE_LEVEL_DTYPE = pd.CategoricalDtype(['HIGH', 'MEDIUM', 'LOW', 'VERY_LOW'])
+CLASSIFICATION_METHOD_DTYPE = pd.CategoricalDtype(
+    ['pattern_override', 'hybrid_agreement', 'pattern_priority_conflict', 'segmen_only'])
+
+# Kolom label classify_frame dengan kategori terbuka (tergantung data)
+OPEN_CATEGORICAL_COLS = ('segmen_final', 'cluster_reason', 'kuadran', 'strategi')
+
+
+# Hasil classify() per pelanggan (tuple ringan, field = kolom classify_frame)
+ClassifyResult = namedtuple('ClassifyResult', [
+    'nama_pelanggan', 'segmencustomer_original', 'segmen_final', 'confidence',
+    'confidence_level', 'classification_method', 'conflict_resolved', 'pattern_match',
+    'bandwidth_cluster', 'cluster_reason', 'kuadran', 'strategi', 'nbo'
+])
+
+
+def _broadcast_categorical(values, ids, dtype=None):
+    """Categorical dari nilai per kombinasi unik, di-broadcast ke baris lewat ids"""
+    combo = pd.Categorical(values, dtype=dtype)
+    return pd.Categorical.from_codes(combo.codes[ids], dtype=combo.dtype)
+
+
+def _float_or_nan(token):
+    """float(token), NaN jika token bukan angka valid (mis. '1.2.3')"""
+    try:
+        return float(token)
+    except ValueError:
+        return np.nan
+
+
+def _value_counts(series):
+    """value_counts() dengan urutan sama seperti kolom object (tie = urutan kemunculan), tanpa kategori kosong"""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts()
+    codes = series.cat.codes.to_numpy()
+    codes = codes[codes >= 0]
+    seen = pd.unique(codes)
+    counts = np.bincount(codes, minlength=len(series.cat.categories))
+    return pd.Series(counts[seen], index=pd.Index(series.cat.categories[seen], name=series.name),
+                     name='count').sort_values(ascending=False)
+
+
+def _write_grouped_report(df, group_col, path):
+    """Satu sheet per nilai group_col (urutan kemunculan)"""
+    write_sheets(path, ((str(key)[:31], sub)
+                         for key, sub in df.groupby(group_col, sort=False, observed=True)))
+
+
+# ============================================================================
+# NBO PER KUADRAN (tuple konstan, dibagi semua baris)
+# ============================================================================
+
+_NBO_BANK_CORPORATE_HIGH = (
+    'Upgrade to Managed SD-WAN',
+    'DDoS Protection Service',
+    'Cloud Backup & Recovery',
+    'Managed Security Operations Center',
+    'Digital Branch Solutions',
+)
+_NBO_BANK_BRANCH_STANDARD = (
+    'Upgrade bandwidth untuk cabang',
+    'ATM Network Optimization',
+    'Secure VPN Expansion',
+)
+_NBO_BANKING_PREMIUM = (
+    'Dedicated Backbone Connection',
+    'Redundancy & Failover',
+    'Private Cloud Infrastructure',
+    '24/7 Premium SLA',
+)
+_NBO_SEKOLAH_MENENGAH = (
+    'Campus-wide WiFi Management',
+    'E-Learning Platform Support',
+    'Digital Library Connection',
+    'Video Conference Setup',
+)
+_NBO_UNIVERSITAS_RESEARCH = (
+    'Dedicated Research Internet',
+    'High-performance Computing Connection',
+    'International Eduroam',
+    'Smart Campus Platform',
+)
+_NBO_INSTITUSI_PENDIDIKAN = (
+    'Basic Connectivity Upgrade',
+    'School Management System',
+    'Digital Content Platform',
+)
+_NBO_GOV_KEMENTERIAN = (
+    'AP2T Integration',
+    'National Data Center Connection',
+    'Smart Government Platform',
+    'Secure Inter-ministry Network',
+)
+_NBO_GOV_DINAS_LOKAL = (
+    'E-Government Platform',
+    'Public Service Optimization',
+    'Regional Data Integration',
+    'Smart City Infrastructure',
+)
+_NBO_GOV_INSTANSI = (
+    'Public WiFi Services',
+    'Digital Document Management',
+    'Online Service Portal',
+)
+_NBO_RUMAH_SAKIT_BESAR = (
+    'Hospital Information System (HIS)',
+    'Telemedicine Platform',
+    'Medical IoT Integration',
+    'PACS (Medical Imaging)',
+    'Secure Healthcare Network',
+)
+_NBO_KLINIK_PUSKESMAS = (
+    'Reliable Internet for Telemedicine',
+    'Cloud-based Medical Records',
+    'Video Consultation Setup',
+)
+_NBO_TELCO_INFRASTRUCTURE = (
+    'MetroNet Expansion',
+    'Dark Fiber Leasing',
+    'IP Transit Optimization',
+    '5G Backhaul Infrastructure',
+    'Network Monitoring Services',
+)
+_NBO_INFRASTRUKTUR_TRANSPORTASI = (
+    'IoT Fleet Management',
+    'Real-time Passenger Info System',
+    'Secure Control Network',
+    'Smart Ticketing Platform',
+)
+_NBO_OPERATOR_TRANSPORTASI = (
+    'Fleet Tracking System',
+    'Online Booking Platform',
+    'Customer WiFi Services',
+)
+_NBO_INDUSTRI_4_0 = (
+    'Industrial IoT Platform',
+    'Smart Manufacturing Network',
+    'Predictive Maintenance System',
+    'Secure OT-IT Integration',
+    'Private 5G for Industry',
+)
+_NBO_PABRIK_MENENGAH = (
+    'Reliable Production Network',
+    'CCTV & Security System',
+    'ERP System Connectivity',
+)
+_NBO_RETAIL_DISTRIBUTION = (
+    'Supply Chain Visibility',
+    'Multi-branch Connectivity',
+    'POS System Integration',
+    'Warehouse Management System',
+)
+_NBO_HOSPITALITY = (
+    'Premium Guest WiFi',
+    'Smart Room Solutions',
+    'Hotel Management System',
+    'Digital Concierge Platform',
+)
+_NBO_UMKM_DIGITAL = (
+    'Basic Business Internet',
+    'Online Presence Support',
+    'Digital Payment Integration',
+    'Social Media Marketing Tools',
+)
+_NBO_NON_BW_SERVICES = ('Basic Internet Package', 'Managed Service Add-on')
+_NBO_ATM_IOT_DEVICES = ('Ensure SLA compliance', 'Monitoring Services')
+_NBO_UMKM_SMALL = ('Bandwidth Upgrade', 'Basic Security Package')
+_NBO_CORPORATE_STANDARD = (
+    'Bandwidth Upgrade',
+    'Managed Services',
+    'Security',
+)
+_NBO_ENTERPRISE_PREMIUM = (
+    'Premium SLA',
+    'Optimization Services',
+    'Consulting',
+)
+
+
 class SmartCustomerClassifier:
     """
     Smart Customer Classifier dengan Hybrid Approach:
     Pattern Recognition (Nama) + segmencustomer + Bandwidth
     """
     
+    # Keyword nama yang dipakai rule cluster/kuadran, dan batas bandwidth-nya
+    NAME_FLAGS = ('KEMENTERIAN', 'GUBERNUR', 'DINAS', 'UNIV', 'RUMAH SAKIT',
+                  'KERETA API', 'BANDAR UDARA', 'SMK', 'SMA')
+    BW_EDGES = np.array([20, 50, 100, 500, 1000], dtype=np.float64)
+    
     def __init__(self):
         self.pattern_recognizer = SmartPatternRecognizer()
     
@@ -230,10 +583,15 @@ class SmartCustomerClassifier:
         Klasifikasi cerdas dengan hybrid approach
         
         Returns:
-            dict: Hasil klasifikasi lengkap dengan confidence
+            ClassifyResult: Hasil klasifikasi lengkap dengan confidence
         """
+        # Nama dinormalisasi sekali, dipakai ulang oleh semua step
+        nama_upper = str(nama_pelanggan).upper().strip()
+        
         # STEP 1: Pattern Recognition dari Nama
-        pattern_result = self.pattern_recognizer.recognize_pattern(nama_pelanggan)
+        pattern_result = self.pattern_recognizer._recognize_normalized(nama_upper)
+        if pattern_result:
+            pattern_result = dict(pattern_result)
         
         # STEP 2: Smart Conflict Resolution
         if pattern_result and pattern_result['confidence'] >= 0.85:
@@ -265,46 +623,210 @@ class SmartCustomerClassifier:
         
         # STEP 3: Segmen-Aware Bandwidth Clustering
         cluster, cluster_reason = self._determine_bandwidth_cluster(
-            final_segmen, bandwidth_mbps, nama_pelanggan
+            final_segmen, bandwidth_mbps, nama_upper
         )
         
         # STEP 4: Determine Strategic Quadrant
         kuadran, strategi, nbo = self._determine_quadrant_and_nbo(
-            final_segmen, cluster, bandwidth_mbps, pendapatan, tier, nama_pelanggan
+            final_segmen, cluster, bandwidth_mbps, pendapatan, tier, nama_upper
         )
         
-        return {
-            'nama_pelanggan': nama_pelanggan,
-            'segmencustomer_original': segmencustomer,
-            'segmen_final': final_segmen,
+        return ClassifyResult(
+            nama_pelanggan=nama_pelanggan,
+            segmencustomer_original=segmencustomer,
+            segmen_final=final_segmen,
+            confidence=confidence,
+            confidence_level=self.pattern_recognizer.get_confidence_level(confidence),
+            classification_method=classification_method,
+            conflict_resolved=conflict_resolved,
+            pattern_match=pattern_result,
+            bandwidth_cluster=cluster,
+            cluster_reason=cluster_reason,
+            kuadran=kuadran,
+            strategi=strategi,
+            nbo=list(nbo)
+        )
+    
+    def classify_frame(self, df):
+        """
+        Versi vectorized dari classify() untuk satu DataFrame penuh
+        (kolom: nama_pelanggan, segmencustomer, bandwidth_mbps)
+        
+        Returns:
+            DataFrame: kolom = ClassifyResult._fields, index sama dengan df;
+            kolom label berupa Categorical
+        """
+        n = len(df)
+        recognizer = SmartPatternRecognizer
+        nama_raw = df['nama_pelanggan'] if 'nama_pelanggan' in df else pd.Series('', index=df.index)
+        segmen_raw = df['segmencustomer'] if 'segmencustomer' in df else pd.Series('UNKNOWN', index=df.index)
+        bw_raw = df['bandwidth_mbps'] if 'bandwidth_mbps' in df else pd.Series(0, index=df.index)
+        
+        names = pd.Series(nama_raw.to_numpy(), dtype=object).astype(str).str.upper().str.strip()
+        bw = pd.to_numeric(pd.Series(bw_raw.to_numpy()), errors='coerce').to_numpy(dtype=np.float64)
+        
+        # STEP 1: Pattern Recognition - satu regex alternation per segmen,
+        # lalu boost per keyword hanya pada baris yang kena
+        best_conf = np.zeros(n)
+        best_rank = np.full(n, -1, dtype=np.int16)
+        seg_start = 0
+        for segmen, data in recognizer.PATTERNS.items():
+            seg_ranks = range(seg_start, seg_start + len(data['keywords']))
+            seg_start = seg_ranks.stop
+            seg_rows = np.flatnonzero(names.str.contains(recognizer._SEGMENT_RE[segmen], na=False).to_numpy())
+            if not len(seg_rows):
+                continue
+            seg_names = names.iloc[seg_rows]
+            for rank in seg_ranks:
+                keyword = recognizer._KW_TEXT[rank]
+                hit = seg_names.str.contains(keyword, regex=False).to_numpy()
+                if not hit.any():
+                    continue
+                rows = seg_rows[hit]
+                kw_names = seg_names[hit]
+                conf = np.full(len(rows), recognizer._KW_WEIGHT[rank])
+                conf = np.where(kw_names.str.startswith(keyword).to_numpy(),
+                                np.minimum(0.99, conf + 0.05), conf)
+                ptcv = kw_names.str.contains(recognizer._PTCV_RE[keyword]).to_numpy()
+                conf = np.where(ptcv, np.minimum(0.99, conf + 0.03), conf)
+                
+                better = conf > best_conf[rows]
+                best_conf[rows[better]] = conf[better]
+                best_rank[rows[better]] = rank
+        
+        matched = best_rank >= 0
+        match_rank = np.where(matched, best_rank, 0)
+        best_seg = np.where(matched, recognizer._KW_SEGMEN[match_rank], None)
+        
+        # STEP 2: Smart Conflict Resolution
+        segmen_orig = segmen_raw.to_numpy(dtype=object)
+        segmen_str = pd.Series(segmen_orig).astype(str)
+        compatible = matched & (
+            (recognizer._KW_IS_EDUCATION[match_rank] & segmen_str.str.contains('EDUCATION', regex=False).to_numpy())
+            | (recognizer._KW_IS_BANKING[match_rank] & segmen_str.str.contains('BANKING', regex=False).to_numpy())
+            | (best_seg == segmen_str.to_numpy())
+        )
+        strong = best_conf >= 0.85
+        medium = (best_conf >= 0.70) & ~strong
+        agree = medium & compatible
+        conflict = medium & ~compatible
+        use_pattern = strong | conflict
+        
+        final_segmen = np.where(use_pattern, best_seg, segmen_orig)
+        confidence = np.select([strong | agree, conflict], [best_conf, best_conf - 0.10], default=0.60)
+        classification_method = pd.Categorical.from_codes(
+            np.select([strong, agree, conflict], [0, 1, 2], default=3),
+            dtype=CLASSIFICATION_METHOD_DTYPE
+        )
+        confidence_level = pd.Categorical.from_codes(
+            np.select([confidence >= 0.90, confidence >= 0.75, confidence >= 0.50], [0, 1, 2], default=3),
+            dtype=CONFIDENCE_LEVEL_DTYPE
+        )
+        pattern_match = np.full(n, None, dtype=object)
+        pattern_rows = np.flatnonzero(strong | medium)
+        pattern_ranks = best_rank[pattern_rows]
+        pattern_match[pattern_rows] = [
+            {
+                'segmen': segmen,
+                'confidence': conf,
+                'matched_keyword': keyword,
+                'accuracy': accuracy,
+                'method': 'pattern_recognition'
+            }
+            for segmen, conf, keyword, accuracy in zip(
+                recognizer._KW_SEGMEN[pattern_ranks], best_conf[pattern_rows].tolist(),
+                recognizer._KW_TEXT[pattern_ranks], recognizer._KW_ACCURACY[pattern_ranks].tolist()
+            )
+        ]
+        
+        # STEP 3-4: Cluster & Kuadran hanya bergantung pada segmen, posisi bandwidth
+        # terhadap batas rule, dan keyword nama -> evaluasi sekali per kombinasi unik
+        no_bw = np.isnan(bw) | (bw == 0)
+        bw_bucket = np.where(bw < 1, 0, 1 + np.searchsorted(self.BW_EDGES, bw, side='left'))
+        bw_bucket[no_bw] = -1
+        name_flags = np.zeros(n, dtype=np.int16)
+        for bit, word in enumerate(self.NAME_FLAGS):
+            name_flags |= names.str.contains(word, regex=False).to_numpy().astype(np.int16) << bit
+        
+        # Kombinasi di-encode sebagai satu key int64: segmen id | bucket bw | flag nama
+        segmen_id, _ = pd.factorize(final_segmen, use_na_sentinel=False)
+        combo_key = ((segmen_id.astype(np.int64) << 3 | (bw_bucket + 1))
+                     << len(self.NAME_FLAGS) | name_flags)
+        _, first_rows, combo_id = np.unique(combo_key, return_index=True, return_inverse=True)
+        
+        n_combo = len(first_rows)
+        combo_cluster = np.empty(n_combo, dtype=object)
+        combo_reason = np.empty(n_combo, dtype=object)
+        combo_kuadran = np.empty(n_combo, dtype=object)
+        combo_strategi = np.empty(n_combo, dtype=object)
+        combo_nbo = [None] * n_combo
+        for c, i in enumerate(first_rows):
+            cluster, reason = self._determine_bandwidth_cluster(final_segmen[i], bw[i], names.iat[i])
+            kuadran, strategi, nbo = self._determine_quadrant_and_nbo(
+                final_segmen[i], cluster, bw[i], None, None, names.iat[i]
+            )
+            combo_cluster[c], combo_reason[c] = cluster, reason
+            combo_kuadran[c], combo_strategi[c], combo_nbo[c] = kuadran, strategi, nbo
+        
+        return pd.DataFrame({
+            'nama_pelanggan': nama_raw.to_numpy(),
+            'segmencustomer_original': segmen_orig,
+            'segmen_final': pd.Categorical(final_segmen),
             'confidence': confidence,
-            'confidence_level': self.pattern_recognizer.get_confidence_level(confidence),
+            'confidence_level': confidence_level,
             'classification_method': classification_method,
-            'conflict_resolved': conflict_resolved,
-            'pattern_match': pattern_result,
-            'bandwidth_cluster': cluster,
-            'cluster_reason': cluster_reason,
-            'kuadran': kuadran,
-            'strategi': strategi,
-            'nbo': nbo
-        }
+            'conflict_resolved': use_pattern,
+            'pattern_match': pattern_match,
+            'bandwidth_cluster': _broadcast_categorical(combo_cluster, combo_id, BANDWIDTH_CLUSTER_DTYPE),
+            'cluster_reason': _broadcast_categorical(combo_reason, combo_id),
+            'kuadran': _broadcast_categorical(combo_kuadran, combo_id),
+            'strategi': _broadcast_categorical(combo_strategi, combo_id),
+            'nbo': [list(combo_nbo[c]) for c in combo_id]
+        }, index=df.index)
+    
+    def classify_parallel(self, df, n_jobs=None, min_chunk_rows=50_000):
+        """
+        classify_frame() dibagi per chunk baris ke beberapa proses
+        (baris independen, hasil sama dengan classify_frame)
+        """
+        n_jobs = n_jobs or os.cpu_count() or 1
+        n_chunks = min(n_jobs, -(-len(df) // min_chunk_rows))
+        if n_chunks <= 1:
+            return self.classify_frame(df)
+        
+        # Kirim hanya kolom input ke worker
+        cols = [c for c in ('nama_pelanggan', 'segmencustomer', 'bandwidth_mbps') if c in df.columns]
+        bounds = np.linspace(0, len(df), n_chunks + 1).astype(int)
+        chunks = [df.iloc[start:end][cols] for start, end in zip(bounds[:-1], bounds[1:])]
+        
+        with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+            result = pd.concat(executor.map(self.classify_frame, chunks))
+        
+        # Kategori per chunk berbeda -> concat jatuh ke object, encode ulang
+        for col in OPEN_CATEGORICAL_COLS:
+            result[col] = result[col].astype('category')
+        return result
     
     def _is_segmen_compatible(self, pattern_segmen, data_segmen):
         """Check apakah pattern segmen compatible dengan data segmen"""
-        # EDUCATION grouping
-        if 'EDUCATION' in pattern_segmen and 'EDUCATION' in str(data_segmen):
-            return True
-        # BANK grouping
-        if 'BANKING' in pattern_segmen and 'BANKING' in str(data_segmen):
+        return self._segmen_compatible(pattern_segmen, str(data_segmen))
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _segmen_compatible(pattern_segmen, data_segmen):
+        """_is_segmen_compatible untuk data segmen string (domain kecil, di-cache)"""
+        # EDUCATION / BANK grouping
+        family = _SEGMEN_FAMILY.get(pattern_segmen)
+        if family and family in data_segmen:
             return True
         # Default: exact match
-        return pattern_segmen == str(data_segmen)
+        return pattern_segmen == data_segmen
     
-    def _determine_bandwidth_cluster(self, segmen, bandwidth_mbps, nama_pelanggan):
+    def _determine_bandwidth_cluster(self, segmen, bandwidth_mbps, nama):
         """
         Determine bandwidth cluster berdasarkan segmen (Segmen-Aware)
+        (nama sudah uppercase)
         """
-        nama = str(nama_pelanggan).upper()
         
         # NO_BANDWIDTH check
         if bandwidth_mbps == 0 or pd.isna(bandwidth_mbps):
@@ -405,16 +927,16 @@ class SmartCustomerClassifier:
         else:
             return 'ENTERPRISE', 'Enterprise'
     
-    def _determine_quadrant_and_nbo(self, segmen, cluster, bandwidth_mbps, pendapatan, tier, nama_pelanggan):
+    def _determine_quadrant_and_nbo(self, segmen, cluster, bandwidth_mbps, pendapatan, tier, nama):
         """
         Determine strategic quadrant dan NBO berdasarkan segmen + cluster
+        (nama sudah uppercase)
         """
-        nama = str(nama_pelanggan).upper()
         
         # Initialize
         kuadran = None
         strategi = None
-        nbo = []
+        nbo = ()
         
         # === BANKING & FINANCIAL ===
         if 'BANKING' in segmen or segmen == 'BANKING & FINANCIAL':
@@ -422,220 +944,127 @@ class SmartCustomerClassifier:
                 if bandwidth_mbps > 100:
                     kuadran = '[BANK] BANK CORPORATE HIGH'
                     strategi = 'UPSELL + SECURITY: Digital Banking Infrastructure'
-                    nbo = [
-                        'Upgrade to Managed SD-WAN',
-                        'DDoS Protection Service',
-                        'Cloud Backup & Recovery',
-                        'Managed Security Operations Center',
-                        'Digital Branch Solutions'
-                    ]
+                    nbo = _NBO_BANK_CORPORATE_HIGH
                 else:
                     kuadran = '[BANK] BANK BRANCH STANDARD'
                     strategi = 'UPSELL: Branch Connectivity Enhancement'
-                    nbo = [
-                        'Upgrade bandwidth untuk cabang',
-                        'ATM Network Optimization',
-                        'Secure VPN Expansion'
-                    ]
+                    nbo = _NBO_BANK_BRANCH_STANDARD
             elif cluster == 'ENTERPRISE':
                 kuadran = '[BANK] BANKING PREMIUM'
                 strategi = 'RETENTION + PREMIUM: Core Banking Infrastructure'
-                nbo = [
-                    'Dedicated Backbone Connection',
-                    'Redundancy & Failover',
-                    'Private Cloud Infrastructure',
-                    '24/7 Premium SLA'
-                ]
+                nbo = _NBO_BANKING_PREMIUM
         
         # === EDUCATION ===
         elif 'EDUCATION' in segmen:
             if 'SMK' in nama or 'SMA' in nama:
                 kuadran = ' SEKOLAH MENENGAH'
                 strategi = 'UPSELL: Digital Learning Infrastructure'
-                nbo = [
-                    'Campus-wide WiFi Management',
-                    'E-Learning Platform Support',
-                    'Digital Library Connection',
-                    'Video Conference Setup'
-                ]
+                nbo = _NBO_SEKOLAH_MENENGAH
             elif 'UNIVERSITAS' in nama or 'UNIV' in nama:
                 kuadran = ' UNIVERSITAS RESEARCH'
                 strategi = 'CROSS-SELL: Research & Education Solutions'
-                nbo = [
-                    'Dedicated Research Internet',
-                    'High-performance Computing Connection',
-                    'International Eduroam',
-                    'Smart Campus Platform'
-                ]
+                nbo = _NBO_UNIVERSITAS_RESEARCH
             else:  # Yayasan, dll
                 kuadran = ' INSTITUSI PENDIDIKAN'
                 strategi = 'EDUKASI: Digital Transformation'
-                nbo = [
-                    'Basic Connectivity Upgrade',
-                    'School Management System',
-                    'Digital Content Platform'
-                ]
+                nbo = _NBO_INSTITUSI_PENDIDIKAN
         
         # === GOVERNMENT ===
         elif segmen == 'GOVERNMENT':
             if 'KEMENTERIAN' in nama:
                 kuadran = '[GOV] KEMENTERIAN LEVEL'
                 strategi = 'CROSS-SELL: National Infrastructure'
-                nbo = [
-                    'AP2T Integration',
-                    'National Data Center Connection',
-                    'Smart Government Platform',
-                    'Secure Inter-ministry Network'
-                ]
+                nbo = _NBO_GOV_KEMENTERIAN
             elif 'DINAS' in nama:
                 kuadran = '[GOV] DINAS LOKAL'
                 strategi = 'CROSS-SELL: Smart City Solutions'
-                nbo = [
-                    'E-Government Platform',
-                    'Public Service Optimization',
-                    'Regional Data Integration',
-                    'Smart City Infrastructure'
-                ]
+                nbo = _NBO_GOV_DINAS_LOKAL
             else:
                 kuadran = '[GOV] INSTANSI PEMERINTAH'
                 strategi = 'EDUKASI: Digital Services'
-                nbo = [
-                    'Public WiFi Services',
-                    'Digital Document Management',
-                    'Online Service Portal'
-                ]
+                nbo = _NBO_GOV_INSTANSI
         
         # === HEALTH CARE ===
         elif segmen == 'HEALTH CARE':
             if 'RUMAH SAKIT' in nama or bandwidth_mbps > 50:
                 kuadran = '[HOSPITAL] RUMAH SAKIT BESAR'
                 strategi = 'CROSS-SELL: Healthcare Digitalization'
-                nbo = [
-                    'Hospital Information System (HIS)',
-                    'Telemedicine Platform',
-                    'Medical IoT Integration',
-                    'PACS (Medical Imaging)',
-                    'Secure Healthcare Network'
-                ]
+                nbo = _NBO_RUMAH_SAKIT_BESAR
             else:
                 kuadran = '[HOSPITAL] KLINIK/PUSKESMAS'
                 strategi = 'UPSELL: Healthcare Connectivity'
-                nbo = [
-                    'Reliable Internet for Telemedicine',
-                    'Cloud-based Medical Records',
-                    'Video Consultation Setup'
-                ]
+                nbo = _NBO_KLINIK_PUSKESMAS
         
         # === SELULAR OPERATOR ===
         elif segmen == 'SELULAR OPERATOR PROVIDER':
             kuadran = '[SAT] TELCO INFRASTRUCTURE'
             strategi = 'RETENTION + OPTIMIZATION: Network Backbone'
-            nbo = [
-                'MetroNet Expansion',
-                'Dark Fiber Leasing',
-                'IP Transit Optimization',
-                '5G Backhaul Infrastructure',
-                'Network Monitoring Services'
-            ]
+            nbo = _NBO_TELCO_INFRASTRUCTURE
         
         # === TRANSPORTATION ===
         elif segmen == 'TRANSPORTATION':
             if 'KERETA API' in nama or 'BANDAR UDARA' in nama:
                 kuadran = ' INFRASTRUKTUR TRANSPORTASI'
                 strategi = 'CROSS-SELL: Smart Transportation'
-                nbo = [
-                    'IoT Fleet Management',
-                    'Real-time Passenger Info System',
-                    'Secure Control Network',
-                    'Smart Ticketing Platform'
-                ]
+                nbo = _NBO_INFRASTRUKTUR_TRANSPORTASI
             else:
                 kuadran = ' OPERATOR TRANSPORTASI'
                 strategi = 'DIGITALISASI: Transport Services'
-                nbo = [
-                    'Fleet Tracking System',
-                    'Online Booking Platform',
-                    'Customer WiFi Services'
-                ]
+                nbo = _NBO_OPERATOR_TRANSPORTASI
         
         # === MANUFACTURE / INDUSTRY ===
         elif segmen in ['MANUFACTURE', 'ENERGY UTILITY MINING', 'NATURAL RESOURCES']:
             if cluster == 'ENTERPRISE':
                 kuadran = '[FACTORY] INDUSTRI 4.0'
                 strategi = 'CROSS-SELL: Smart Factory Solutions'
-                nbo = [
-                    'Industrial IoT Platform',
-                    'Smart Manufacturing Network',
-                    'Predictive Maintenance System',
-                    'Secure OT-IT Integration',
-                    'Private 5G for Industry'
-                ]
+                nbo = _NBO_INDUSTRI_4_0
             else:
                 kuadran = '[FACTORY] PABRIK MENENGAH'
                 strategi = 'UPSELL: Industrial Connectivity'
-                nbo = [
-                    'Reliable Production Network',
-                    'CCTV & Security System',
-                    'ERP System Connectivity'
-                ]
+                nbo = _NBO_PABRIK_MENENGAH
         
         # === RETAIL DISTRIBUTION ===
         elif segmen == 'RETAIL DISTRIBUTION':
             kuadran = ' RETAIL DISTRIBUTION'
             strategi = 'DIGITAL: Supply Chain Solutions'
-            nbo = [
-                'Supply Chain Visibility',
-                'Multi-branch Connectivity',
-                'POS System Integration',
-                'Warehouse Management System'
-            ]
+            nbo = _NBO_RETAIL_DISTRIBUTION
         
         # === HOSPITALITY ===
         elif segmen == 'HOSPITALITY':
             kuadran = ' HOSPITALITY'
             strategi = 'GUEST EXPERIENCE: Digital Hospitality'
-            nbo = [
-                'Premium Guest WiFi',
-                'Smart Room Solutions',
-                'Hotel Management System',
-                'Digital Concierge Platform'
-            ]
+            nbo = _NBO_HOSPITALITY
         
         # === UMKM (explicit) ===
         elif segmen == 'UMKM & RETAIL':
             kuadran = ' UMKM DIGITAL'
             strategi = 'EDUKASI: Digital Business Enablement'
-            nbo = [
-                'Basic Business Internet',
-                'Online Presence Support',
-                'Digital Payment Integration',
-                'Social Media Marketing Tools'
-            ]
+            nbo = _NBO_UMKM_DIGITAL
         
         # Default berdasarkan cluster
         else:
             if cluster == 'NO_BANDWIDTH':
                 kuadran = '[BRIEFCASE] NON-BW SERVICES'
                 strategi = 'CROSS-SELL: Add Connectivity'
-                nbo = ['Basic Internet Package', 'Managed Service Add-on']
+                nbo = _NBO_NON_BW_SERVICES
             elif cluster == 'ATM_IOT':
                 kuadran = '[SAT] ATM/IoT DEVICES'
                 strategi = 'MAINTENANCE: Reliability'
-                nbo = ['Ensure SLA compliance', 'Monitoring Services']
+                nbo = _NBO_ATM_IOT_DEVICES
             elif cluster == 'UMKM_SMALL':
                 kuadran = ' UMKM/SMALL'
                 strategi = 'GROWTH: Upgrade to Corporate'
-                nbo = ['Bandwidth Upgrade', 'Basic Security Package']
+                nbo = _NBO_UMKM_SMALL
             elif cluster == 'CORPORATE':
                 kuadran = '[OFFICE] CORPORATE STANDARD'
                 strategi = 'UPSELL + CROSS-SELL'
-                nbo = ['Bandwidth Upgrade', 'Managed Services', 'Security']
+                nbo = _NBO_CORPORATE_STANDARD
             else:  # ENTERPRISE
                 kuadran = '[OFFICE] ENTERPRISE PREMIUM'
                 strategi = 'RETENTION + OPTIMIZATION'
-                nbo = ['Premium SLA', 'Optimization Services', 'Consulting']
+                nbo = _NBO_ENTERPRISE_PREMIUM
         
-        return kuadran, strategi, nbo[:5]  # Return top 5 NBO
+        return kuadran, strategi, nbo  # Tuple konstan, maks 5 NBO
 
 
 # ============================================================================
@@ -645,6 +1074,14 @@ class SmartCustomerClassifier:
 class CVOSmartClassifier:
     """Main CVO class with Smart Classification"""
     
+    # Kolom laporan (yang tidak ada di data dilewati)
+    REPORT_COLS = (
+        'nama_pelanggan', 'segmencustomer_original', 'segmen_final',
+        'confidence', 'confidence_level', 'classification_method',
+        'bandwidth_fix', 'bandwidth_mbps', 'bandwidth_cluster',
+        'kuadran', 'strategi', 'nbo', 'tier', 'pendapatan'
+    )
+    
     def __init__(self, data_path):
         self.data_path = data_path
         self.df_raw = None
@@ -656,7 +1093,8 @@ class CVOSmartClassifier:
     def load_and_process(self):
         """Load dan preprocess data"""
         print("\n[DATA] Memuat data...")
-        self.df_raw = pd.read_excel(self.data_path, engine='openpyxl')
+        # Semua kolom dibaca: High Confidence report mengekspor frame lengkap
+        self.df_raw = read_excel_cached(self.data_path, self.data_path + '.parquet')
         print(f"[OK] {len(self.df_raw):,} baris data dimuat")
         
         # Column mapping
@@ -675,62 +1113,51 @@ class CVOSmartClassifier:
                 self.df_raw.rename(columns={old: new}, inplace=True)
         
         # Parse bandwidth
-        self.df_raw['bandwidth_mbps'] = self.df_raw['bandwidth_fix'].apply(self._parse_bandwidth)
-        
-        # Clean pendapatan
-        self.df_raw['pendapatan'] = self.df_raw['pendapatan'].astype(str).str.replace(r'[^\d]', '', regex=True)
-        self.df_raw['pendapatan'] = pd.to_numeric(self.df_raw['pendapatan'], errors='coerce').fillna(0)
-        
-        # Filter active
-        self.df_processed = self.df_raw[self.df_raw['status'].str.contains('AKTIF|Aktif', case=False, na=False)]
+        self.df_raw['bandwidth_mbps'] = self._parse_bandwidth(self.df_raw['bandwidth_fix'])
+        
+        # Clean pendapatan: nilai numerik dipakai langsung, regex hanya untuk teks yang gagal diparse
+        pendapatan = pd.to_numeric(self.df_raw['pendapatan'], errors='coerce')
+        is_text = pendapatan.isna() & self.df_raw['pendapatan'].notna()
+        if is_text.any():
+            digits = self.df_raw.loc[is_text, 'pendapatan'].astype(str).str.replace(r'\D+', '', regex=True)
+            pendapatan[is_text] = pd.to_numeric(digits, errors='coerce')
+        self.df_raw['pendapatan'] = pendapatan.fillna(0)
+        downcast_integer(self.df_raw, ['pendapatan'])
+        
+        # Filter active: regex hanya per nilai unik status, hasilnya di-broadcast lewat kode kategori
+        self.df_raw['status'] = self.df_raw['status'].astype('category')
+        status = self.df_raw['status'].cat
+        is_active = pd.Series(status.categories).str.contains('AKTIF|Aktif', case=False, na=False).to_numpy(dtype=bool)
+        self.df_processed = self.df_raw[np.append(is_active, False)[status.codes.to_numpy()]]
         print(f"[OK] {len(self.df_processed):,} pelanggan aktif")
     
-    def _parse_bandwidth(self, val):
-        """Parse bandwidth fix"""
-        if pd.isna(val) or str(val).lower() in ['tidak ada', 'nan', 'none', '-']:
-            return 0
-        
-        val_str = str(val).lower()
-        numbers = re.findall(r"[\d.]+", val_str.replace(',', '.'))
-        
-        if not numbers:
-            return 0
-        
-        try:
-            num = float(numbers[0])
-        except:
-            return 0
-        
-        if 'gbps' in val_str or 'gb' in val_str:
-            return num * 1000
-        elif 'kbps' in val_str or 'kb' in val_str:
-            return num / 1000
-        else:
-            return num
+    def _parse_bandwidth(self, values):
+        """Parse bandwidth fix (vectorized untuk satu Series, hasil dalam Mbps)"""
+        val_str = values.astype(str).str.lower()
+        empty = values.isna().to_numpy() | val_str.isin(['tidak ada', 'nan', 'none', '-']).to_numpy()
+        
+        # Angka pertama; float() hanya sekali per token unik (token tidak valid -> 0)
+        tokens = val_str.str.replace(',', '.', regex=False).str.extract(r'([\d.]+)', expand=False)
+        unique_tokens = tokens.dropna().unique()
+        parsed = pd.Series([_float_or_nan(t) for t in unique_tokens], index=unique_tokens, dtype=np.float64)
+        num = tokens.map(parsed).to_numpy(dtype=np.float64)
+        
+        is_gb = val_str.str.contains('gb', regex=False).to_numpy()
+        is_kb = val_str.str.contains('kb', regex=False).to_numpy() & ~is_gb
+        mbps = np.where(is_gb, num * 1000, np.where(is_kb, num / 1000, num))
+        mbps[empty | np.isnan(mbps)] = 0
+        return mbps
     
     def classify_all(self):
         """Classify semua pelanggan dengan smart classifier"""
         print("\n[TARGET] Melakukan Smart Classification...")
         
-        results = []
-        
-        for idx, row in self.df_processed.iterrows():
-            result = self.smart_classifier.classify(
-                nama_pelanggan=row.get('nama_pelanggan', ''),
-                segmencustomer=row.get('segmencustomer', 'UNKNOWN'),
-                bandwidth_mbps=row.get('bandwidth_mbps', 0),
-                tier=row.get('tier', None),
-                pendapatan=row.get('pendapatan', 0)
-            )
-            
-            # Combine dengan data asli
-            combined = {**row.to_dict(), **result}
-            results.append(combined)
-            
-            if idx % 10000 == 0:
-                print(f"   Progress: {idx:,} / {len(self.df_processed):,}")
-        
-        self.df_classified = pd.DataFrame(results)
+        # Klasifikasi vectorized seluruh frame; kolom hasil ditulis langsung
+        # ke salinan data asli (satu salinan, tanpa assign + reset_index)
+        result = self.smart_classifier.classify_parallel(self.df_processed)
+        self.df_classified = self.df_processed.reset_index(drop=True)
+        for col in result.columns:
+            self.df_classified[col] = result[col].array
         
         # Analysis
         print("\n[DATA] HASIL KLASIFIKASI:")
@@ -738,28 +1165,28 @@ class CVOSmartClassifier:
         
         # By Segmen Final
         print("\nDistribusi Segmen Final:")
-        segmen_dist = self.df_classified['segmen_final'].value_counts()
+        segmen_dist = _value_counts(self.df_classified['segmen_final'])
         for segmen, count in segmen_dist.head(10).items():
             pct = count / len(self.df_classified) * 100
             print(f"  {segmen:30s}: {count:>6,} pel ({pct:>5.1f}%)")
         
         # By Bandwidth Cluster
         print("\nDistribusi Bandwidth Cluster:")
-        cluster_dist = self.df_classified['bandwidth_cluster'].value_counts()
+        cluster_dist = _value_counts(self.df_classified['bandwidth_cluster'])
         for cluster, count in cluster_dist.items():
             pct = count / len(self.df_classified) * 100
             print(f"  {cluster:20s}: {count:>6,} pel ({pct:>5.1f}%)")
         
         # By Kuadran
         print("\nDistribusi Kuadran Strategis:")
-        kuadran_dist = self.df_classified['kuadran'].value_counts()
+        kuadran_dist = _value_counts(self.df_classified['kuadran'])
         for kuadran, count in kuadran_dist.head(10).items():
             pct = count / len(self.df_classified) * 100
             print(f"  {kuadran:35s}: {count:>6,} pel ({pct:>5.1f}%)")
         
         # Confidence Analysis
         print("\nConfidence Score Analysis:")
-        conf_dist = self.df_classified['confidence_level'].value_counts()
+        conf_dist = _value_counts(self.df_classified['confidence_level'])
         for level, count in conf_dist.items():
             pct = count / len(self.df_classified) * 100
             print(f"  {level:10s}: {count:>6,} pel ({pct:>5.1f}%)")
@@ -772,42 +1199,29 @@ class CVOSmartClassifier:
         
         print(f"\n[DOCS] Generating reports in {output_dir}/...")
         
-        # Master report
-        cols_to_export = [
-            'nama_pelanggan', 'segmencustomer_original', 'segmen_final', 
-            'confidence', 'confidence_level', 'classification_method',
-            'bandwidth_fix', 'bandwidth_mbps', 'bandwidth_cluster',
-            'kuadran', 'strategi', 'nbo', 'tier', 'pendapatan'
-        ]
-        
-        # Only export columns that exist
-        cols_exist = [c for c in cols_to_export if c in self.df_classified.columns]
+        # Proyeksi kolom laporan sekali; master dan semua sheet per grup memakai frame ini
+        cols_exist = [c for c in self.REPORT_COLS if c in self.df_classified.columns]
         df_export = self.df_classified[cols_exist]
         
-        # 1. Master Report
-        df_export.to_excel(f'{output_dir}/CVO_Smart_Master.xlsx', index=False)
-        print("  [OK] CVO_Smart_Master.xlsx")
-        
-        # 2. By Segmen Final
-        with pd.ExcelWriter(f'{output_dir}/CVO_Smart_by_Segmen.xlsx') as writer:
-            for segmen in self.df_classified['segmen_final'].unique():
-                sheet_name = str(segmen)[:31]
-                df_segmen = self.df_classified[self.df_classified['segmen_final'] == segmen][cols_exist]
-                df_segmen.to_excel(writer, sheet_name=sheet_name, index=False)
-        print("  [OK] CVO_Smart_by_Segmen.xlsx")
-        
-        # 3. By Bandwidth Cluster
-        with pd.ExcelWriter(f'{output_dir}/CVO_Smart_by_Cluster.xlsx') as writer:
-            for cluster in self.df_classified['bandwidth_cluster'].unique():
-                sheet_name = str(cluster)[:31]
-                df_cluster = self.df_classified[self.df_classified['bandwidth_cluster'] == cluster][cols_exist]
-                df_cluster.to_excel(writer, sheet_name=sheet_name, index=False)
-        print("  [OK] CVO_Smart_by_Cluster.xlsx")
-        
-        # 4. High Confidence Targets
-        high_conf = self.df_classified[self.df_classified['confidence'] >= 0.85]
-        high_conf.to_excel(f'{output_dir}/CVO_Smart_High_Confidence.xlsx', index=False)
-        print("  [OK] CVO_Smart_High_Confidence.xlsx")
+        # Workbook saling independen: kumpulkan job, lalu tulis paralel
+        jobs = [
+            # 1. Master Report
+            (write_sheets, f'{output_dir}/CVO_Smart_Master.xlsx', [('Sheet1', df_export)]),
+            # 2. By Segmen Final
+            (_write_grouped_report, df_export, 'segmen_final', f'{output_dir}/CVO_Smart_by_Segmen.xlsx'),
+            # 3. By Bandwidth Cluster
+            (_write_grouped_report, df_export, 'bandwidth_cluster', f'{output_dir}/CVO_Smart_by_Cluster.xlsx'),
+            # 4. High Confidence Targets
+            (write_sheets, f'{output_dir}/CVO_Smart_High_Confidence.xlsx',
+             [('Sheet1', self.df_classified[self.df_classified['confidence'] >= 0.85])]),
+        ]
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(fn, *args) for fn, *args in jobs]
+            for future in futures:
+                future.result()
+        for name in ('CVO_Smart_Master.xlsx', 'CVO_Smart_by_Segmen.xlsx',
+                     'CVO_Smart_by_Cluster.xlsx', 'CVO_Smart_High_Confidence.xlsx'):
+            print(f"  [OK] {name}")
         
         # 5. Summary statistics
         summary_stats = self._generate_summary_stats()
@@ -819,10 +1233,10 @@ class CVOSmartClassifier:
         """Generate summary statistics"""
         stats = {
             'total_customers': len(self.df_classified),
-            'segmen_distribution': self.df_classified['segmen_final'].value_counts().to_dict(),
-            'cluster_distribution': self.df_classified['bandwidth_cluster'].value_counts().to_dict(),
-            'confidence_distribution': self.df_classified['confidence_level'].value_counts().to_dict(),
-            'classification_method': self.df_classified['classification_method'].value_counts().to_dict(),
+            'segmen_distribution': _value_counts(self.df_classified['segmen_final']).to_dict(),
+            'cluster_distribution': _value_counts(self.df_classified['bandwidth_cluster']).to_dict(),
+            'confidence_distribution': _value_counts(self.df_classified['confidence_level']).to_dict(),
+            'classification_method': _value_counts(self.df_classified['classification_method']).to_dict(),
             'pattern_matches': (self.df_classified['pattern_match'].notna()).sum(),
             'conflicts_resolved': (self.df_classified['conflict_resolved'] == True).sum()
         }
@@ -99,7 +99,7 @@ class NBODataExporter:
             })
         
         with open(f'{self.output_dir}/matrix_revenue_bandwidth.json', 'w', encoding='utf-8') as f:
-            json.dump(records, f, indent=2, ensure_ascii=False)
+            json.dump(records, f, ensure_ascii=False)
         
         print(f"   [OK] matrix_revenue_bandwidth.json ({len(records)} records)")
     
@@ -126,7 +126,7 @@ class NBODataExporter:
             })
         
         with open(f'{self.output_dir}/matrix_revenue_tenure.json', 'w', encoding='utf-8') as f:
-            json.dump(records, f, indent=2, ensure_ascii=False)
+            json.dump(records, f, ensure_ascii=False)
         
         print(f"   [OK] matrix_revenue_tenure.json ({len(records)} records)")
     
@@ -239,7 +239,7 @@ class NBODataExporter:
             })
         
         with open(f'{self.output_dir}/nbo_sniper.json', 'w', encoding='utf-8') as f:
-            json.dump(sniper_list, f, indent=2, ensure_ascii=False)
+            json.dump(sniper_list, f, ensure_ascii=False)
         
         print(f"   [OK] nbo_sniper.json ({len(sniper_list)} targets)")
         
@@ -266,7 +266,7 @@ class NBODataExporter:
             })
         
         with open(f'{self.output_dir}/nbo_risiko.json', 'w', encoding='utf-8') as f:
-            json.dump(risiko_list, f, indent=2, ensure_ascii=False)
+            json.dump(risiko_list, f, ensure_ascii=False)
         
         print(f"   [OK] nbo_risiko.json ({len(risiko_list)} targets)")
     
@@ -295,7 +295,7 @@ class NBODataExporter:
             })
         
         with open(f'{self.output_dir}/top_50_opportunities.json', 'w', encoding='utf-8') as f:
-            json.dump(opportunities, f, indent=2, ensure_ascii=False)
+            json.dump(opportunities, f, ensure_ascii=False)
         
         print(f"   [OK] top_50_opportunities.json ({len(opportunities)} opportunities)")
     
@@ -1,7 +1,9 @@
 """Fix emoji characters in Python files for Windows compatibility"""
 
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 # Emoji to text replacements
 EMOJI_MAP = {
@@ -76,33 +78,51 @@ EMOJI_MAP = {
     '🚦': '[TRAFFIC]',
 }
 
+# All EMOJI_MAP keys in one alternation, longest first so '🎖️' wins over '🎖'
+_EMOJI_ALT = re.compile('|'.join(re.escape(k) for k in sorted(EMOJI_MAP, key=len, reverse=True)))
+
+# Every emoji below (and every EMOJI_MAP key) is >= U+24C2, whose UTF-8 lead byte is >= 0xE2
+_EMOJI_LEAD_BYTE = re.compile(rb'[\xe2-\xff]')
+
+# Compiled once at import, reused for every file
+_EMOJI_RE = re.compile("["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    u"\U00002702-\U000027B0"
+    u"\U000024C2-\U0001F251"
+    u"\U0001F900-\U0001F9FF"  # supplemental symbols
+    u"\U0001FA00-\U0001FA6F"  # chess symbols
+    u"\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-a
+    "]+", flags=re.UNICODE)
+
 def remove_emojis(text):
     """Remove all emojis from text"""
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        u"\U00002702-\U000027B0"
-        u"\U000024C2-\U0001F251"
-        u"\U0001F900-\U0001F9FF"  # supplemental symbols
-        u"\U0001FA00-\U0001FA6F"  # chess symbols
-        u"\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-a
-        "]+", flags=re.UNICODE)
-    return emoji_pattern.sub(r'', text)
+    return _EMOJI_RE.sub('', text)
 
 def fix_file(filepath):
-    """Fix emojis in a single file"""
-    print(f"Processing: {filepath}")
+    """Fix emojis in a single file; returns its log lines (printed in order by the caller)"""
+    log = [f"Processing: {filepath}"]
+    
+    # Scan the raw bytes via mmap first; only decode files that may contain emojis
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            has_candidates = False  # mmap cannot map an empty file
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                has_candidates = _EMOJI_LEAD_BYTE.search(mm) is not None
+    if not has_candidates:
+        log.append(f"  [NONE] No emojis in {filepath}")
+        return log
     
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
     
     original = content
     
-    # Replace known emojis with text equivalents
-    for emoji, replacement in EMOJI_MAP.items():
-        content = content.replace(emoji, replacement)
+    # Replace known emojis with text equivalents (single pass)
+    content = _EMOJI_ALT.sub(lambda m: EMOJI_MAP[m.group(0)], content)
     
     # Remove any remaining emojis
     content = remove_emojis(content)
@@ -110,9 +130,10 @@ def fix_file(filepath):
     if original != content:
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
-        print(f"  [FIXED] {filepath}")
+        log.append(f"  [FIXED] {filepath}")
     else:
-        print(f"  [NONE] No emojis in {filepath}")
+        log.append(f"  [NONE] No emojis in {filepath}")
+    return log
 
 # Fix main files
 files_to_fix = [
@@ -121,11 +142,18 @@ files_to_fix = [
     'cvo_nbo_v30.py',
 ]
 
+filepaths = []
 for filename in files_to_fix:
     filepath = os.path.join('D:\\ICON+', filename)
     if os.path.exists(filepath):
-        fix_file(filepath)
+        filepaths.append(filepath)
     else:
         print(f"File not found: {filepath}")
 
+# Files are independent; threads overlap the read/write I/O, logs are printed in input order
+if filepaths:
+    with ThreadPoolExecutor(max_workers=min(8, len(filepaths))) as executor:
+        for log in executor.map(fix_file, filepaths):
+            print('\n'.join(log))
+
 print("\nDone!")
@@ -17,35 +17,63 @@ import seaborn as sns
 from datetime import datetime
 import os
 
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Set style
 plt.style.use('default')
 sns.set_palette("husl")
 
+DATA_PATH = 'Data Penuh Pelanggan Aktif.xlsx'
+# Cleaned revenue/bandwidth/tenure, reused on reruns while newer than DATA_PATH
+CACHE_PATH = 'data_cache_v2.parquet'  # v2: old caches held bandwidth = 0
+
+# Only these columns are used by the matrices
+SOURCE_COLUMNS = ('hargaPelanggan', 'Lama_Langganan', 'bandwidth', 'Bandwidth Fix')
+
 def load_data():
     """Load data from Excel"""
     print("[DATA] Loading data...")
-    df = pd.read_excel('Data Penuh Pelanggan Aktif.xlsx', engine='openpyxl')
+    if PYARROW_AVAILABLE and os.path.exists(CACHE_PATH) \
+            and os.path.getmtime(CACHE_PATH) >= os.path.getmtime(DATA_PATH):
+        df = pd.read_parquet(CACHE_PATH, engine='pyarrow')
+        print(f"[OK] Loaded {len(df)} customers (cache: {CACHE_PATH})")
+        return df
+    
+    df = pd.read_excel(
+        DATA_PATH, engine='openpyxl',
+        engine_kwargs={'read_only': True, 'data_only': True, 'keep_links': False},
+        usecols=lambda col: col in SOURCE_COLUMNS
+    )
     
     # Clean and prepare
     df['revenue'] = pd.to_numeric(df['hargaPelanggan'], errors='coerce').fillna(0)
     df['tenure'] = pd.to_numeric(df['Lama_Langganan'], errors='coerce').fillna(0)
     
     # Bandwidth
-    df['bandwidth'] = 0
     if 'bandwidth' in df.columns:
         df['bandwidth'] = pd.to_numeric(df['bandwidth'], errors='coerce').fillna(0)
     elif 'Bandwidth Fix' in df.columns:
-        def parse_bw(val):
-            if pd.isna(val) or val == 'Tidak Ada':
-                return 0
-            import re
-            match = re.search(r'(\d+)', str(val))
-            return int(match.group(1)) if match else 0
-        df['bandwidth'] = df['Bandwidth Fix'].apply(parse_bw)
+        # First number in e.g. "20 MBPS"; 0 when empty or 'Tidak Ada' (one vectorized regex pass)
+        bw_raw = df['Bandwidth Fix']
+        bw_raw = bw_raw.where(bw_raw.ne('Tidak Ada'))
+        bw_num = bw_raw.astype('string').str.extract(r'(\d+)', expand=False)
+        df['bandwidth'] = pd.to_numeric(bw_num, errors='coerce').fillna(0).astype('int64')
+    else:
+        df['bandwidth'] = 0
     
     # Filter customers with meaningful data
     df = df[df['revenue'] > 0]
     
+    if PYARROW_AVAILABLE:
+        try:
+            df[['revenue', 'bandwidth', 'tenure']].to_parquet(CACHE_PATH, engine='pyarrow', index=False)
+        except Exception as e:
+            print(f"[WARN] Could not write cache {CACHE_PATH}: {e}")
+    
     print(f"[OK] Loaded {len(df)} customers")
     return df
 
@@ -60,6 +88,15 @@ def create_dual_matrix(df, output_path='cvo_dual_matrix.png'):
     bandwidth_median = df_sample['bandwidth'].median() if df_sample['bandwidth'].median() > 0 else 100
     tenure_median = df_sample['tenure'].median() if df_sample['tenure'].median() > 0 else 3
     
+    # Axis comparisons computed once as NumPy arrays; each quadrant combines two of them
+    rev = df_sample['revenue'].to_numpy()
+    bw = df_sample['bandwidth'].to_numpy()
+    ten = df_sample['tenure'].to_numpy()
+    rev_jt = rev / 1000000
+    hi_rev, lo_rev = rev >= revenue_median, rev < revenue_median
+    hi_bw, lo_bw = bw >= bandwidth_median, bw < bandwidth_median
+    hi_ten, lo_ten = ten >= tenure_median, ten < tenure_median
+    
     # Create figure with 2 subplots side by side
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 8))
     fig.suptitle('CVO DUAL MATRIX ANALYSIS\nPLN Icon+ Customer Value Optimizer', 
@@ -70,7 +107,7 @@ def create_dual_matrix(df, output_path='cvo_dual_matrix.png'):
                   fontsize=14, fontweight='bold', pad=20)
     
     # Plot all points
-    scatter1 = ax1.scatter(df_sample['bandwidth'], df_sample['revenue']/1000000, 
+    scatter1 = ax1.scatter(bw, rev_jt, 
                           c='lightgray', s=150, alpha=0.6, edgecolors='black', linewidth=1)
     
     # Add quadrant lines
@@ -79,32 +116,28 @@ def create_dual_matrix(df, output_path='cvo_dual_matrix.png'):
     
     # Color code quadrants
     # Q1: High Revenue, High Bandwidth (STAR CLIENTS - Green)
-    star_clients = df_sample[(df_sample['revenue'] >= revenue_median) & 
-                             (df_sample['bandwidth'] >= bandwidth_median)]
-    ax1.scatter(star_clients['bandwidth'], star_clients['revenue']/1000000, 
+    star_clients = hi_rev & hi_bw
+    ax1.scatter(bw[star_clients], rev_jt[star_clients], 
                c='#2E7D32', s=200, alpha=0.8, edgecolors='darkgreen', linewidth=2, 
-               label=f'STAR CLIENTS ({len(star_clients)})', zorder=5)
+               label=f'STAR CLIENTS ({star_clients.sum()})', zorder=5)
     
     # Q2: High Revenue, Low Bandwidth (RISK AREA - Red/Orange)
-    risk_area = df_sample[(df_sample['revenue'] >= revenue_median) & 
-                          (df_sample['bandwidth'] < bandwidth_median)]
-    ax1.scatter(risk_area['bandwidth'], risk_area['revenue']/1000000, 
+    risk_area = hi_rev & lo_bw
+    ax1.scatter(bw[risk_area], rev_jt[risk_area], 
                c='#FF6F00', s=200, alpha=0.8, edgecolors='darkorange', linewidth=2,
-               label=f'RISK AREA ({len(risk_area)})', zorder=5)
+               label=f'RISK AREA ({risk_area.sum()})', zorder=5)
     
     # Q3: Low Revenue, High Bandwidth (SNIPER ZONE - Blue/Red)
-    sniper_zone = df_sample[(df_sample['revenue'] < revenue_median) & 
-                            (df_sample['bandwidth'] >= bandwidth_median)]
-    ax1.scatter(sniper_zone['bandwidth'], sniper_zone['revenue']/1000000, 
+    sniper_zone = lo_rev & hi_bw
+    ax1.scatter(bw[sniper_zone], rev_jt[sniper_zone], 
                c='#C62828', s=250, alpha=0.9, edgecolors='darkred', linewidth=3,
-               marker='X', label=f'SNIPER ZONE ({len(sniper_zone)})', zorder=6)
+               marker='X', label=f'SNIPER ZONE ({sniper_zone.sum()})', zorder=6)
     
     # Q4: Low Revenue, Low Bandwidth (INVEST/INCUBATOR - Gray)
-    incubator = df_sample[(df_sample['revenue'] < revenue_median) & 
-                          (df_sample['bandwidth'] < bandwidth_median)]
-    ax1.scatter(incubator['bandwidth'], incubator['revenue']/1000000, 
+    incubator = lo_rev & lo_bw
+    ax1.scatter(bw[incubator], rev_jt[incubator], 
                c='#757575', s=150, alpha=0.5, edgecolors='gray', linewidth=1,
-               label=f'INVEST/INCUBATOR ({len(incubator)})', zorder=4)
+               label=f'INVEST/INCUBATOR ({incubator.sum()})', zorder=4)
     
     # Add annotations
     ax1.text(0.95, 0.95, 'STAR CLIENTS\n(High Revenue, High Bandwidth)\nPertahankan!', 
@@ -136,7 +169,7 @@ def create_dual_matrix(df, output_path='cvo_dual_matrix.png'):
                   fontsize=14, fontweight='bold', pad=20)
     
     # Plot all points
-    scatter2 = ax2.scatter(df_sample['tenure'], df_sample['revenue']/1000000, 
+    scatter2 = ax2.scatter(ten, rev_jt, 
                           c='lightgray', s=150, alpha=0.6, edgecolors='black', linewidth=1)
     
     # Add quadrant lines
@@ -145,32 +178,28 @@ def create_dual_matrix(df, output_path='cvo_dual_matrix.png'):
     
     # Color code quadrants dengan nama Indonesia
     # Q1: High Revenue, Long Tenure (SULTAN LOYAL - Green)
-    sultan_loyal = df_sample[(df_sample['revenue'] >= revenue_median) & 
-                             (df_sample['tenure'] >= tenure_median)]
-    ax2.scatter(sultan_loyal['tenure'], sultan_loyal['revenue']/1000000, 
+    sultan_loyal = hi_rev & hi_ten
+    ax2.scatter(ten[sultan_loyal], rev_jt[sultan_loyal], 
                c='#2E7D32', s=200, alpha=0.8, edgecolors='darkgreen', linewidth=2, 
-               label=f'SULTAN LOYAL ({len(sultan_loyal)})', zorder=5)
+               label=f'SULTAN LOYAL ({sultan_loyal.sum()})', zorder=5)
     
     # Q2: High Revenue, Short Tenure (ORANG KAYA BARU - Blue)
-    orang_kaya_baru = df_sample[(df_sample['revenue'] >= revenue_median) & 
-                                (df_sample['tenure'] < tenure_median)]
-    ax2.scatter(orang_kaya_baru['tenure'], orang_kaya_baru['revenue']/1000000, 
+    orang_kaya_baru = hi_rev & lo_ten
+    ax2.scatter(ten[orang_kaya_baru], rev_jt[orang_kaya_baru], 
                c='#1565C0', s=200, alpha=0.8, edgecolors='darkblue', linewidth=2,
-               label=f'ORANG KAYA BARU ({len(orang_kaya_baru)})', zorder=5)
+               label=f'ORANG KAYA BARU ({orang_kaya_baru.sum()})', zorder=5)
     
     # Q3: Low Revenue, Long Tenure (SAHABAT HEMAT - Orange)
-    sahabat_hemat = df_sample[(df_sample['revenue'] < revenue_median) & 
-                              (df_sample['tenure'] >= tenure_median)]
-    ax2.scatter(sahabat_hemat['tenure'], sahabat_hemat['revenue']/1000000, 
+    sahabat_hemat = lo_rev & hi_ten
+    ax2.scatter(ten[sahabat_hemat], rev_jt[sahabat_hemat], 
                c='#EF6C00', s=200, alpha=0.8, edgecolors='darkorange', linewidth=2,
-               label=f'SAHABAT HEMAT ({len(sahabat_hemat)})', zorder=5)
+               label=f'SAHABAT HEMAT ({sahabat_hemat.sum()})', zorder=5)
     
     # Q4: Low Revenue, Short Tenure (PEMULA - Gray)
-    pemula = df_sample[(df_sample['revenue'] < revenue_median) & 
-                       (df_sample['tenure'] < tenure_median)]
-    ax2.scatter(pemula['tenure'], pemula['revenue']/1000000, 
+    pemula = lo_rev & lo_ten
+    ax2.scatter(ten[pemula], rev_jt[pemula], 
                c='#757575', s=150, alpha=0.5, edgecolors='gray', linewidth=1,
-               label=f'PEMULA ({len(pemula)})', zorder=4)
+               label=f'PEMULA ({pemula.sum()})', zorder=4)
     
     # Add annotations dengan nama Indonesia
     ax2.text(0.95, 0.95, '💚 SULTAN LOYAL\n(High Revenue + Long Tenure)\nStrategi: High-Value Cross-Sell\nTawarkan: PV Rooftop, Smart Office', 
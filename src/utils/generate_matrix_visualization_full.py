@@ -17,35 +17,63 @@ import seaborn as sns
 from datetime import datetime
 import os
 
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Set style
 plt.style.use('default')
 sns.set_palette("husl")
 
+DATA_PATH = 'Data Penuh Pelanggan Aktif.xlsx'
+# Cleaned revenue/bandwidth/tenure, reused on reruns while newer than DATA_PATH
+CACHE_PATH = 'data_cache_v2.parquet'  # v2: old caches held bandwidth = 0
+
+# Only these columns are used by the matrices
+SOURCE_COLUMNS = ('hargaPelanggan', 'Lama_Langganan', 'bandwidth', 'Bandwidth Fix')
+
 def load_data():
     """Load FULL data from Excel"""
     print("[DATA] Loading FULL data...")
-    df = pd.read_excel('Data Penuh Pelanggan Aktif.xlsx', engine='openpyxl')
+    if PYARROW_AVAILABLE and os.path.exists(CACHE_PATH) \
+            and os.path.getmtime(CACHE_PATH) >= os.path.getmtime(DATA_PATH):
+        df = pd.read_parquet(CACHE_PATH, engine='pyarrow')
+        print(f"[OK] Loaded {len(df):,} customers (FULL DATA, cache: {CACHE_PATH})")
+        return df
+    
+    df = pd.read_excel(
+        DATA_PATH, engine='openpyxl',
+        engine_kwargs={'read_only': True, 'data_only': True, 'keep_links': False},
+        usecols=lambda col: col in SOURCE_COLUMNS
+    )
     
     # Clean and prepare
     df['revenue'] = pd.to_numeric(df['hargaPelanggan'], errors='coerce').fillna(0)
     df['tenure'] = pd.to_numeric(df['Lama_Langganan'], errors='coerce').fillna(0)
     
     # Bandwidth
-    df['bandwidth'] = 0
     if 'bandwidth' in df.columns:
         df['bandwidth'] = pd.to_numeric(df['bandwidth'], errors='coerce').fillna(0)
     elif 'Bandwidth Fix' in df.columns:
-        def parse_bw(val):
-            if pd.isna(val) or val == 'Tidak Ada':
-                return 0
-            import re
-            match = re.search(r'(\d+)', str(val))
-            return int(match.group(1)) if match else 0
-        df['bandwidth'] = df['Bandwidth Fix'].apply(parse_bw)
+        # First number in e.g. "20 MBPS"; 0 when empty or 'Tidak Ada' (one vectorized regex pass)
+        bw_raw = df['Bandwidth Fix']
+        bw_raw = bw_raw.where(bw_raw.ne('Tidak Ada'))
+        bw_num = bw_raw.astype('string').str.extract(r'(\d+)', expand=False)
+        df['bandwidth'] = pd.to_numeric(bw_num, errors='coerce').fillna(0).astype('int64')
+    else:
+        df['bandwidth'] = 0
     
     # Filter customers with meaningful data
     df = df[df['revenue'] > 0]
     
+    if PYARROW_AVAILABLE:
+        try:
+            df[['revenue', 'bandwidth', 'tenure']].to_parquet(CACHE_PATH, engine='pyarrow', index=False)
+        except Exception as e:
+            print(f"[WARN] Could not write cache {CACHE_PATH}: {e}")
+    
     print(f"[OK] Loaded {len(df):,} customers (FULL DATA)")
     return df
 
@@ -62,6 +90,15 @@ def create_dual_matrix_full(df, output_path='cvo_dual_matrix_full.png'):
     bandwidth_median = df_all['bandwidth'].median() if df_all['bandwidth'].median() > 0 else 100
     tenure_median = df_all['tenure'].median() if df_all['tenure'].median() > 0 else 3
     
+    # Axis comparisons computed once as NumPy arrays; each quadrant combines two of them
+    rev = df_all['revenue'].to_numpy()
+    bw = df_all['bandwidth'].to_numpy()
+    ten = df_all['tenure'].to_numpy()
+    rev_jt = rev / 1000000
+    hi_rev, lo_rev = rev >= revenue_median, rev < revenue_median
+    hi_bw, lo_bw = bw >= bandwidth_median, bw < bandwidth_median
+    hi_ten, lo_ten = ten >= tenure_median, ten < tenure_median
+    
     print(f"   Revenue Median: Rp {revenue_median:,.0f}")
     print(f"   Bandwidth Median: {bandwidth_median:.1f} Mbps")
     print(f"   Tenure Median: {tenure_median:.1f} years")
@@ -76,57 +113,53 @@ def create_dual_matrix_full(df, output_path='cvo_dual_matrix_full.png'):
                   fontsize=13, fontweight='bold', pad=15)
     
     # Classify all customers
-    star_clients = df_all[(df_all['revenue'] >= revenue_median) & 
-                          (df_all['bandwidth'] >= bandwidth_median)]
-    risk_area = df_all[(df_all['revenue'] >= revenue_median) & 
-                       (df_all['bandwidth'] < bandwidth_median)]
-    sniper_zone = df_all[(df_all['revenue'] < revenue_median) & 
-                         (df_all['bandwidth'] >= bandwidth_median)]
-    incubator = df_all[(df_all['revenue'] < revenue_median) & 
-                       (df_all['bandwidth'] < bandwidth_median)]
-    
-    print(f"   Star Clients: {len(star_clients):,}")
-    print(f"   Risk Area: {len(risk_area):,}")
-    print(f"   Sniper Zone: {len(sniper_zone):,}")
-    print(f"   Incubator: {len(incubator):,}")
+    star_clients = hi_rev & hi_bw
+    risk_area = hi_rev & lo_bw
+    sniper_zone = lo_rev & hi_bw
+    incubator = lo_rev & lo_bw
+    
+    print(f"   Star Clients: {star_clients.sum():,}")
+    print(f"   Risk Area: {risk_area.sum():,}")
+    print(f"   Sniper Zone: {sniper_zone.sum():,}")
+    print(f"   Incubator: {incubator.sum():,}")
     
     # Plot with density-appropriate sizing
     # Incubator (gray) - largest group, smallest points
-    ax1.scatter(incubator['bandwidth'], incubator['revenue']/1000000, 
+    ax1.scatter(bw[incubator], rev_jt[incubator], 
                c='#BDBDBD', s=15, alpha=0.4, edgecolors='none',
-               label=f'INVEST/INCUBATOR ({len(incubator):,})', zorder=1)
+               label=f'INVEST/INCUBATOR ({incubator.sum():,})', zorder=1)
     
     # Risk Area (orange)
-    ax1.scatter(risk_area['bandwidth'], risk_area['revenue']/1000000, 
+    ax1.scatter(bw[risk_area], rev_jt[risk_area], 
                c='#FF9800', s=25, alpha=0.6, edgecolors='darkorange', linewidth=0.5,
-               label=f'RISK AREA ({len(risk_area):,})', zorder=3)
+               label=f'RISK AREA ({risk_area.sum():,})', zorder=3)
     
     # Star Clients (green)
-    ax1.scatter(star_clients['bandwidth'], star_clients['revenue']/1000000, 
+    ax1.scatter(bw[star_clients], rev_jt[star_clients], 
                c='#4CAF50', s=30, alpha=0.7, edgecolors='darkgreen', linewidth=0.5, 
-               label=f'STAR CLIENTS ({len(star_clients):,})', zorder=4)
+               label=f'STAR CLIENTS ({star_clients.sum():,})', zorder=4)
     
     # Sniper Zone (red) - TARGET, highlighted
-    ax1.scatter(sniper_zone['bandwidth'], sniper_zone['revenue']/1000000, 
+    ax1.scatter(bw[sniper_zone], rev_jt[sniper_zone], 
                c='#F44336', s=35, alpha=0.8, edgecolors='darkred', linewidth=1,
-               marker='o', label=f'SNIPER ZONE ({len(sniper_zone):,})', zorder=5)
+               marker='o', label=f'SNIPER ZONE ({sniper_zone.sum():,})', zorder=5)
     
     # Add quadrant lines
     ax1.axhline(y=revenue_median/1000000, color='gray', linestyle='--', alpha=0.5, linewidth=2)
     ax1.axvline(x=bandwidth_median, color='gray', linestyle='--', alpha=0.5, linewidth=2)
     
     # Add annotations
-    ax1.text(0.97, 0.97, f'STAR CLIENTS\n(High Revenue, High BW)\n{len(star_clients):,} pelanggan\nPertahankan!', 
+    ax1.text(0.97, 0.97, f'STAR CLIENTS\n(High Revenue, High BW)\n{star_clients.sum():,} pelanggan\nPertahankan!', 
              transform=ax1.transAxes, fontsize=10, fontweight='bold',
              verticalalignment='top', horizontalalignment='right',
              bbox=dict(boxstyle='round', facecolor='#C8E6C9', alpha=0.9, edgecolor='green', linewidth=2))
     
-    ax1.text(0.03, 0.97, f'RISK AREA\n(High Revenue, Low BW)\n{len(risk_area):,} pelanggan\nRawan Komplain', 
+    ax1.text(0.03, 0.97, f'RISK AREA\n(High Revenue, Low BW)\n{risk_area.sum():,} pelanggan\nRawan Komplain', 
              transform=ax1.transAxes, fontsize=10, fontweight='bold',
              verticalalignment='top', horizontalalignment='left',
              bbox=dict(boxstyle='round', facecolor='#FFE0B2', alpha=0.9, edgecolor='orange', linewidth=2))
     
-    ax1.text(0.97, 0.03, f'[TARGET] SNIPER ZONE\n{len(sniper_zone):,} Klien Undervalued\nHigh Usage, Low Price\n\nACTION: TAWARKAN UPGRADE!', 
+    ax1.text(0.97, 0.03, f'[TARGET] SNIPER ZONE\n{sniper_zone.sum():,} Klien Undervalued\nHigh Usage, Low Price\n\nACTION: TAWARKAN UPGRADE!', 
              transform=ax1.transAxes, fontsize=11, fontweight='bold', color='darkred',
              verticalalignment='bottom', horizontalalignment='right',
              bbox=dict(boxstyle='round,pad=0.5', facecolor='#FFCDD2', alpha=0.95, 
@@ -145,62 +178,58 @@ def create_dual_matrix_full(df, output_path='cvo_dual_matrix_full.png'):
                   fontsize=13, fontweight='bold', pad=15)
     
     # Classify by tenure
-    sultan_loyal = df_all[(df_all['revenue'] >= revenue_median) & 
-                          (df_all['tenure'] >= tenure_median)]
-    orang_kaya_baru = df_all[(df_all['revenue'] >= revenue_median) & 
-                             (df_all['tenure'] < tenure_median)]
-    sahabat_hemat = df_all[(df_all['revenue'] < revenue_median) & 
-                           (df_all['tenure'] >= tenure_median)]
-    pemula = df_all[(df_all['revenue'] < revenue_median) & 
-                    (df_all['tenure'] < tenure_median)]
-    
-    print(f"   Sultan Loyal: {len(sultan_loyal):,}")
-    print(f"   Orang Kaya Baru: {len(orang_kaya_baru):,}")
-    print(f"   Sahabat Hemat: {len(sahabat_hemat):,}")
-    print(f"   Pemula: {len(pemula):,}")
+    sultan_loyal = hi_rev & hi_ten
+    orang_kaya_baru = hi_rev & lo_ten
+    sahabat_hemat = lo_rev & hi_ten
+    pemula = lo_rev & lo_ten
+    
+    print(f"   Sultan Loyal: {sultan_loyal.sum():,}")
+    print(f"   Orang Kaya Baru: {orang_kaya_baru.sum():,}")
+    print(f"   Sahabat Hemat: {sahabat_hemat.sum():,}")
+    print(f"   Pemula: {pemula.sum():,}")
     
     # Plot dengan density-appropriate sizing
     # Pemula (gray)
-    ax2.scatter(pemula['tenure'], pemula['revenue']/1000000, 
+    ax2.scatter(ten[pemula], rev_jt[pemula], 
                c='#9E9E9E', s=15, alpha=0.4, edgecolors='none',
-               label=f'PEMULA ({len(pemula):,})', zorder=1)
+               label=f'PEMULA ({pemula.sum():,})', zorder=1)
     
     # Sahabat Hemat (orange)
-    ax2.scatter(sahabat_hemat['tenure'], sahabat_hemat['revenue']/1000000, 
+    ax2.scatter(ten[sahabat_hemat], rev_jt[sahabat_hemat], 
                c='#FF9800', s=25, alpha=0.6, edgecolors='darkorange', linewidth=0.5,
-               label=f'SAHABAT HEMAT ({len(sahabat_hemat):,})', zorder=3)
+               label=f'SAHABAT HEMAT ({sahabat_hemat.sum():,})', zorder=3)
     
     # Orang Kaya Baru (blue)
-    ax2.scatter(orang_kaya_baru['tenure'], orang_kaya_baru['revenue']/1000000, 
+    ax2.scatter(ten[orang_kaya_baru], rev_jt[orang_kaya_baru], 
                c='#2196F3', s=30, alpha=0.7, edgecolors='darkblue', linewidth=0.5,
-               label=f'ORANG KAYA BARU ({len(orang_kaya_baru):,})', zorder=4)
+               label=f'ORANG KAYA BARU ({orang_kaya_baru.sum():,})', zorder=4)
     
     # Sultan Loyal (green)
-    ax2.scatter(sultan_loyal['tenure'], sultan_loyal['revenue']/1000000, 
+    ax2.scatter(ten[sultan_loyal], rev_jt[sultan_loyal], 
                c='#4CAF50', s=35, alpha=0.8, edgecolors='darkgreen', linewidth=1,
-               label=f'SULTAN LOYAL ({len(sultan_loyal):,})', zorder=5)
+               label=f'SULTAN LOYAL ({sultan_loyal.sum():,})', zorder=5)
     
     # Add quadrant lines
     ax2.axhline(y=revenue_median/1000000, color='gray', linestyle='--', alpha=0.5, linewidth=2)
     ax2.axvline(x=tenure_median, color='gray', linestyle='--', alpha=0.5, linewidth=2)
     
     # Add annotations dengan count
-    ax2.text(0.97, 0.97, f'SULTAN LOYAL\n(High Revenue + Long Tenure)\n{len(sultan_loyal):,} pelanggan\nStrategi: High-Value Cross-Sell\nTawarkan: PV Rooftop, Smart Office', 
+    ax2.text(0.97, 0.97, f'SULTAN LOYAL\n(High Revenue + Long Tenure)\n{sultan_loyal.sum():,} pelanggan\nStrategi: High-Value Cross-Sell\nTawarkan: PV Rooftop, Smart Office', 
              transform=ax2.transAxes, fontsize=9, fontweight='bold',
              verticalalignment='top', horizontalalignment='right',
              bbox=dict(boxstyle='round', facecolor='#C8E6C9', alpha=0.9, edgecolor='green', linewidth=2))
     
-    ax2.text(0.03, 0.97, f'ORANG KAYA BARU\n(High Revenue + Short Tenure)\n{len(orang_kaya_baru):,} pelanggan\nStrategi: Onboarding\nTawarkan: Bundling Sederhana', 
+    ax2.text(0.03, 0.97, f'ORANG KAYA BARU\n(High Revenue + Short Tenure)\n{orang_kaya_baru.sum():,} pelanggan\nStrategi: Onboarding\nTawarkan: Bundling Sederhana', 
              transform=ax2.transAxes, fontsize=9, fontweight='bold',
              verticalalignment='top', horizontalalignment='left',
              bbox=dict(boxstyle='round', facecolor='#BBDEFB', alpha=0.9, edgecolor='blue', linewidth=2))
     
-    ax2.text(0.97, 0.03, f'SAHABAT HEMAT\n(Low Revenue + Long Tenure)\n{len(sahabat_hemat):,} pelanggan\nStrategi: Nudging / Trial\nTawarkan: Trial 1 Minggu', 
+    ax2.text(0.97, 0.03, f'SAHABAT HEMAT\n(Low Revenue + Long Tenure)\n{sahabat_hemat.sum():,} pelanggan\nStrategi: Nudging / Trial\nTawarkan: Trial 1 Minggu', 
              transform=ax2.transAxes, fontsize=9, fontweight='bold',
              verticalalignment='bottom', horizontalalignment='right',
              bbox=dict(boxstyle='round', facecolor='#FFE0B2', alpha=0.9, edgecolor='orange', linewidth=2))
     
-    ax2.text(0.03, 0.03, f'PEMULA\n(Low Revenue + Short Tenure)\n{len(pemula):,} pelanggan\nStrategi: Observation\nAction: Program Incubator', 
+    ax2.text(0.03, 0.03, f'PEMULA\n(Low Revenue + Short Tenure)\n{pemula.sum():,} pelanggan\nStrategi: Observation\nAction: Program Incubator', 
              transform=ax2.transAxes, fontsize=9, fontweight='bold',
              verticalalignment='bottom', horizontalalignment='left',
              bbox=dict(boxstyle='round', facecolor='#F5F5F5', alpha=0.9, edgecolor='gray', linewidth=2))